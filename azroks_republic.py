@@ -6,23 +6,122 @@ representing a sector (Teachers, Builders, Miners, or Military).
 Some are Brothers of the Republic; others are secret Agents of the Drow.
 """
 
-import math
+import functools
 import random
-from typing import Dict, List, Optional, Tuple
-from enum import Enum
+from array import array
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from enum import IntEnum
 
 
 SECTORS = ["Teachers", "Builders", "Miners", "Military"]
 
+# Failure results shared by every call that hits them
+_ERR_NOT_INVESTMENT_PHASE = (False, "Not in investment phase")
+_ERR_NOT_YOUR_TURN = (False, "Not your turn")
+_ERR_AMOUNT_NOT_WHOLE = (False, "Amount must be a whole number")
+_ERR_AMOUNT_NOT_POSITIVE = (False, "Amount must be positive")
+_ERR_NOT_ENOUGH_MONEY = (False, "Not enough money")
+_ERR_MAX_IMPROVEMENT = (False, "Already at maximum improvement level")
+_ERR_TAX_ALREADY_USED = (False, "Already used tax this turn")
+_ERR_TAX_SELF = (False, "Cannot tax yourself")
+_ERR_INVALID_TARGET = (False, "Invalid target player")
+_ERR_TAX_NOT_ENOUGH_MONEY = (False, "Not enough money to tax")
 
-class AzrokGameState(Enum):
+
+def _war_cost_table(num_players: int, max_rounds: int) -> Tuple[int, ...]:
+    """
+    Build the war cost for every round number from 0 to max_rounds + 1.
+
+    Rounds 0-3 cost $1 per player, rounds 4-6 cost $2 and later rounds
+    cost $3. The trailing entry covers the round counter stepping past
+    the last round.
+    """
+    costs = []
+    for rnd in range(max_rounds + 2):
+        if rnd <= 3:
+            costs.append(1 * num_players)
+        elif rnd <= 6:
+            costs.append(2 * num_players)
+        else:
+            costs.append(3 * num_players)
+    return tuple(costs)
+
+
+def _turn_order_table(num_players: int) -> Dict[Tuple[int, int], Tuple[int, ...]]:
+    """
+    Build the turn order for every (general secretary, dice roll) pairing.
+
+    The General Secretary sits in position 1 and positions continue
+    clockwise; the dice roll picks which position takes the first turn.
+    """
+    table = {}
+    for secretary in range(num_players):
+        positions = tuple((secretary + i) % num_players for i in range(num_players))
+        for roll in range(1, num_players + 1):
+            start_idx = roll - 1
+            table[(secretary, roll)] = positions[start_idx:] + positions[:start_idx]
+    return table
+
+
+class AzrokGameState(IntEnum):
     """Enum representing the state of the game."""
-    SETUP = "setup"
-    INVESTMENT_PHASE = "investment_phase"
-    RESOLUTION_PHASE = "resolution_phase"
-    ROUND_END = "round_end"
-    GAME_WON_REPUBLIC = "game_won_republic"
-    GAME_WON_DROW = "game_won_drow"
+    SETUP = 0
+    INVESTMENT_PHASE = 1
+    RESOLUTION_PHASE = 2
+    ROUND_END = 3
+    GAME_WON_REPUBLIC = 4
+    GAME_WON_DROW = 5
+
+
+# Wire names for each AzrokGameState, indexed by its value
+_STATE_NAMES = (
+    "setup", "investment_phase", "resolution_phase",
+    "round_end", "game_won_republic", "game_won_drow",
+)
+
+
+# Zobrist keys for state_hash(), drawn from a fixed seed so that hashes
+# are stable from one run to the next
+_ZOBRIST_RNG = random.Random(0x5EC7E7A8)
+_ZOBRIST_MASK = (1 << 64) - 1
+
+
+def _zobrist_keys(count: int) -> Tuple[int, ...]:
+    """Draw ``count`` random 64-bit Zobrist keys."""
+    return tuple(_ZOBRIST_RNG.getrandbits(64) for _ in range(count))
+
+
+def _zobrist_rows(rows: int, count: int) -> Tuple[Tuple[int, ...], ...]:
+    """Draw one row of ``count`` Zobrist keys for each of ``rows`` slots."""
+    return tuple(_zobrist_keys(count) for _ in range(rows))
+
+
+def _zobrist(keys: Tuple[int, ...], value: int) -> int:
+    """Look up the key for ``value``, hashing values beyond the table."""
+    if 0 <= value < len(keys):
+        return keys[value]
+    return hash((keys[0], value)) & _ZOBRIST_MASK
+
+
+def _require_turn(method: Callable[..., Tuple[bool, str]]) -> Callable[..., Tuple[bool, str]]:
+    """
+    Guard an investment-phase action so only the current player may take it.
+
+    The wrapped method is called only when the game is in the investment
+    phase and ``player_id`` is the player whose turn it is; otherwise the
+    matching failure tuple is returned without calling it.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "AzroksRepublic", player_id: int, *args, **kwargs) -> Tuple[bool, str]:
+        if self.state != AzrokGameState.INVESTMENT_PHASE:
+            return _ERR_NOT_INVESTMENT_PHASE
+        turn_order = self.turn_order
+        index = self.current_turn_index
+        if index >= len(turn_order) or turn_order[index] != player_id:
+            return _ERR_NOT_YOUR_TURN
+        return method(self, player_id, *args, **kwargs)
+    return wrapper
 
 
 class AzroksRepublic:
@@ -32,7 +131,18 @@ class AzroksRepublic:
     Manages game state, investments, war efforts, and win conditions.
     """
 
+    __slots__ = (
+        "num_players", "state", "current_round",
+        "sectors", "roles", "money", "improvement_level",
+        "general_secretary", "turn_order", "current_turn_index", "has_used_tax",
+        "people_pot", "war_failures",
+        "fruits_deck", "_fruits_idx", "current_fruits_card",
+        "_info", "_info_view", "_rng", "_dice_rolls",
+    )
+
     NUM_PLAYERS = 4
+    # start_round and resolve_round are unrolled for exactly four players
+    assert NUM_PLAYERS == 4
     MAX_ROUNDS = 10
     MAX_WAR_FAILURES = 3
     BASE_SALARY = 2
@@ -43,15 +153,40 @@ class AzroksRepublic:
     AZROKS_DAGGER_COST = 14
     MAX_IMPROVEMENT_LEVEL = 4
 
-    # 10 Fruits of Labor cards with various multipliers
-    FRUITS_OF_LABOR_DECK = [1.5, 1.5, 1.5, 2.0, 2.0, 2.0, 2.5, 2.5, 3.0, 3.0]
-
-    def __init__(self, num_players: int = 4):
+    # 10 Fruits of Labor cards; each multiplier is a (numerator, denominator)
+    # pair so the pot can be scaled with integer arithmetic
+    FRUITS_OF_LABOR_DECK = [
+        (3, 2), (3, 2), (3, 2), (2, 1), (2, 1), (2, 1), (5, 2), (5, 2), (3, 1), (3, 1),
+    ]
+    FALLBACK_FRUITS_CARD = (3, 2)
+
+    # War cost indexed by round number
+    WAR_COSTS = _war_cost_table(NUM_PLAYERS, MAX_ROUNDS)
+
+    # Turn order keyed by (general_secretary, dice_roll)
+    TURN_ORDERS = _turn_order_table(NUM_PLAYERS)
+
+    # Zobrist key tables for state_hash()
+    _Z_STATE = _zobrist_keys(len(AzrokGameState))
+    _Z_ROUND = _zobrist_keys(MAX_ROUNDS + 2)
+    _Z_POT = _zobrist_keys(256)
+    _Z_WAR_FAILURES = _zobrist_keys(MAX_WAR_FAILURES + 1)
+    _Z_SECRETARY = _zobrist_keys(NUM_PLAYERS)
+    _Z_TURN_INDEX = _zobrist_keys(NUM_PLAYERS + 1)
+    _Z_FRUITS_DRAWN = _zobrist_keys(len(FRUITS_OF_LABOR_DECK) + 2)
+    _Z_MONEY = _zobrist_rows(NUM_PLAYERS, 64)
+    _Z_LEVEL = _zobrist_rows(NUM_PLAYERS, MAX_IMPROVEMENT_LEVEL + 1)
+    _Z_TAX_USED = _zobrist_keys(NUM_PLAYERS)
+    _Z_TURN_ORDER = _zobrist_rows(NUM_PLAYERS, NUM_PLAYERS)
+
+    def __init__(self, num_players: int = 4, seed: Optional[int] = None):
         """
         Initialize Azrok's Republic game.
 
         Args:
             num_players: Number of players (must be 4)
+            seed: Optional seed for this game's random draws, for
+                reproducible games
 
         Raises:
             ValueError: If number of players is not 4
@@ -65,11 +200,15 @@ class AzroksRepublic:
         self.state = AzrokGameState.SETUP
         self.current_round = 0
 
-        # Player state
-        self.sectors: Dict[int, str] = {i: SECTORS[i] for i in range(num_players)}
-        self.roles: Dict[int, str] = {}
-        self.money: Dict[int, int] = {i: 0 for i in range(num_players)}
-        self.improvement_level: Dict[int, int] = {i: 1 for i in range(num_players)}
+        # Random source for roles, dice and the deck
+        self._rng = random.Random(seed)
+        self._dice_rolls: Tuple[int, ...] = self._roll_dice()
+
+        # Player state, one slot per player ID
+        self.sectors: List[str] = SECTORS[:num_players]
+        self.roles: List[str] = []
+        self.money = array("i", [0] * num_players)
+        self.improvement_level = array("i", [1] * num_players)
 
         # General Secretary
         self.general_secretary: int = 0
@@ -77,7 +216,7 @@ class AzroksRepublic:
         # Turn tracking
         self.turn_order: List[int] = []
         self.current_turn_index: int = 0
-        self.has_used_tax: Dict[int, bool] = {i: False for i in range(num_players)}
+        self.has_used_tax: List[bool] = [False] * num_players
 
         # People pot
         self.people_pot: int = 0
@@ -85,9 +224,20 @@ class AzroksRepublic:
         # War tracking
         self.war_failures: int = 0
 
-        # Fruits of Labor deck
-        self.fruits_deck: List[float] = []
-        self.current_fruits_card: Optional[float] = None
+        # Fruits of Labor deck, drawn front to back via _fruits_idx
+        self.fruits_deck: Tuple[Tuple[int, int], ...] = ()
+        self._fruits_idx: int = 0
+        self.current_fruits_card: Optional[Tuple[int, int]] = None
+
+        # Backing dict for get_game_info(); the fixed fields are filled in
+        # once here and the rest are refreshed on each call
+        self._info: dict = {
+            "num_players": num_players,
+            "max_rounds": self.MAX_ROUNDS,
+            "max_war_failures": self.MAX_WAR_FAILURES,
+            "sectors": tuple(self.sectors),
+        }
+        self._info_view: Mapping = MappingProxyType(self._info)
 
     def setup_game(self) -> None:
         """Set up the game: assign roles, General Secretary, and shuffle deck."""
@@ -96,26 +246,84 @@ class AzroksRepublic:
             "Brother of the Republic", "Brother of the Republic",
             "Agent of the Drow", "Agent of the Drow",
         ]
-        random.shuffle(roles)
-        self.roles = {i: roles[i] for i in range(self.num_players)}
+        rng = self._rng
+        rng.shuffle(roles)
+        self.roles = roles
 
         # Assign General Secretary randomly
-        self.general_secretary = random.randint(0, self.num_players - 1)
+        self.general_secretary = rng.randrange(self.num_players)
 
         # Prepare Fruits of Labor deck
-        self.fruits_deck = self.FRUITS_OF_LABOR_DECK.copy()
-        random.shuffle(self.fruits_deck)
+        deck = list(self.FRUITS_OF_LABOR_DECK)
+        rng.shuffle(deck)
+        self.fruits_deck = tuple(deck)
+        self._fruits_idx = 0
+
+        # Roll the dice for every round up front
+        self._dice_rolls = self._roll_dice()
 
         self.current_round = 0
 
+    def _roll_dice(self) -> Tuple[int, ...]:
+        """Roll the turn-order die for every round in one batch."""
+        return tuple(self._rng.choices(range(1, self.num_players + 1), k=self.MAX_ROUNDS))
+
+    def clone(self) -> "AzroksRepublic":
+        """
+        Create an independent copy of the game, e.g. for search or rollouts.
+
+        Immutable fields are shared with the original; only the lists that
+        actions mutate in place are copied, making this much cheaper than
+        copy.deepcopy.
+
+        Returns:
+            A new game in the same state as this one.
+        """
+        twin = object.__new__(type(self))
+        for name in self.__slots__:
+            setattr(twin, name, getattr(self, name))
+        twin.money = array("i", self.money)
+        twin.improvement_level = array("i", self.improvement_level)
+        twin.has_used_tax = self.has_used_tax.copy()
+        twin.turn_order = self.turn_order.copy()
+        twin._info = self._info.copy()
+        twin._info_view = MappingProxyType(twin._info)
+        twin._rng = random.Random()
+        twin._rng.setstate(self._rng.getstate())
+        return twin
+
+    def state_hash(self) -> int:
+        """
+        Compute a 64-bit Zobrist hash of the public game state.
+
+        Games in the same public state hash equally, so the value can key
+        a transposition table during search. Secret roles and the order of
+        undrawn Fruits of Labor cards are not part of the hash.
+
+        Returns:
+            Integer hash of the current state.
+        """
+        h = (
+            self._Z_STATE[self.state]
+            ^ _zobrist(self._Z_ROUND, self.current_round)
+            ^ _zobrist(self._Z_POT, self.people_pot)
+            ^ _zobrist(self._Z_WAR_FAILURES, self.war_failures)
+            ^ self._Z_SECRETARY[self.general_secretary]
+            ^ _zobrist(self._Z_TURN_INDEX, self.current_turn_index)
+            ^ _zobrist(self._Z_FRUITS_DRAWN, self._fruits_idx)
+        )
+        for pid in range(self.num_players):
+            h ^= _zobrist(self._Z_MONEY[pid], self.money[pid])
+            h ^= self._Z_LEVEL[pid][self.improvement_level[pid]]
+            if self.has_used_tax[pid]:
+                h ^= self._Z_TAX_USED[pid]
+        for position, pid in enumerate(self.turn_order):
+            h ^= self._Z_TURN_ORDER[position][pid]
+        return h
+
     def get_war_cost(self) -> int:
         """Get the total war cost for the current round."""
-        if self.current_round <= 3:
-            return 1 * self.num_players
-        elif self.current_round <= 6:
-            return 2 * self.num_players
-        else:
-            return 3 * self.num_players
+        return self.WAR_COSTS[self.current_round]
 
     def start_round(self) -> dict:
         """
@@ -134,24 +342,22 @@ class AzroksRepublic:
             return {"success": True, "message": "All rounds complete! The Republic wins!"}
 
         # Pay salary
-        salaries = {}
-        for pid in range(self.num_players):
-            salary = self.BASE_SALARY * self.improvement_level[pid]
-            self.money[pid] += salary
-            salaries[pid] = salary
+        base = self.BASE_SALARY
+        lv0, lv1, lv2, lv3 = self.improvement_level
+        s0, s1, s2, s3 = salaries = [base * lv0, base * lv1, base * lv2, base * lv3]
+        money = self.money
+        money[0] += s0
+        money[1] += s1
+        money[2] += s2
+        money[3] += s3
 
         # Roll for turn order
         # General Secretary is position 1, clockwise from there
-        dice_roll = random.randint(1, self.num_players)
-        positions = [
-            (self.general_secretary + i) % self.num_players
-            for i in range(self.num_players)
-        ]
-        start_idx = dice_roll - 1
-        self.turn_order = positions[start_idx:] + positions[:start_idx]
+        dice_roll = self._dice_rolls[self.current_round - 1]
+        self.turn_order = list(self.TURN_ORDERS[(self.general_secretary, dice_roll)])
 
         self.current_turn_index = 0
-        self.has_used_tax = {i: False for i in range(self.num_players)}
+        self.has_used_tax = [False, False, False, False]
 
         self.state = AzrokGameState.INVESTMENT_PHASE
 
@@ -172,30 +378,31 @@ class AzroksRepublic:
             return None
         return self.turn_order[self.current_turn_index]
 
+    @_require_turn
     def invest_people(self, player_id: int, amount: int) -> Tuple[bool, str]:
         """
         Invest money into the People pot.
 
         Args:
             player_id: ID of the investing player
-            amount: Amount of money to invest
+            amount: Amount of money to invest (a whole number)
 
         Returns:
             Tuple of (success, message)
         """
-        if self.state != AzrokGameState.INVESTMENT_PHASE:
-            return False, "Not in investment phase"
-        if player_id != self.get_current_player():
-            return False, "Not your turn"
+        # Money is held in an int array, so fractional amounts cannot be stored
+        if not isinstance(amount, int):
+            return _ERR_AMOUNT_NOT_WHOLE
         if amount <= 0:
-            return False, "Amount must be positive"
+            return _ERR_AMOUNT_NOT_POSITIVE
         if amount > self.money[player_id]:
-            return False, "Not enough money"
+            return _ERR_NOT_ENOUGH_MONEY
 
         self.money[player_id] -= amount
         self.people_pot += amount
         return True, f"Invested ${amount} into the People"
 
+    @_require_turn
     def invest_improvement(self, player_id: int) -> Tuple[bool, str]:
         """
         Spend $7 to improve labor tools, increasing salary multiplier.
@@ -206,19 +413,16 @@ class AzroksRepublic:
         Returns:
             Tuple of (success, message)
         """
-        if self.state != AzrokGameState.INVESTMENT_PHASE:
-            return False, "Not in investment phase"
-        if player_id != self.get_current_player():
-            return False, "Not your turn"
         if self.money[player_id] < self.IMPROVEMENT_COST:
-            return False, "Not enough money"
+            return _ERR_NOT_ENOUGH_MONEY
         if self.improvement_level[player_id] >= self.MAX_IMPROVEMENT_LEVEL:
-            return False, "Already at maximum improvement level"
+            return _ERR_MAX_IMPROVEMENT
 
         self.money[player_id] -= self.IMPROVEMENT_COST
         self.improvement_level[player_id] += 1
         return True, f"Improved labor tools to {self.improvement_level[player_id]}X"
 
+    @_require_turn
     def use_tax(self, player_id: int, target_id: int) -> Tuple[bool, str]:
         """
         Spend $1 to tax another player $2 (money is discarded).
@@ -230,18 +434,14 @@ class AzroksRepublic:
         Returns:
             Tuple of (success, message)
         """
-        if self.state != AzrokGameState.INVESTMENT_PHASE:
-            return False, "Not in investment phase"
-        if player_id != self.get_current_player():
-            return False, "Not your turn"
         if self.has_used_tax[player_id]:
-            return False, "Already used tax this turn"
+            return _ERR_TAX_ALREADY_USED
         if player_id == target_id:
-            return False, "Cannot tax yourself"
-        if target_id not in self.money:
-            return False, "Invalid target player"
+            return _ERR_TAX_SELF
+        if not 0 <= target_id < self.num_players:
+            return _ERR_INVALID_TARGET
         if self.money[player_id] < self.TAX_COST:
-            return False, "Not enough money to tax"
+            return _ERR_TAX_NOT_ENOUGH_MONEY
 
         self.money[player_id] -= self.TAX_COST
         tax_amount = min(self.TAX_EFFECT, self.money[target_id])
@@ -249,6 +449,7 @@ class AzroksRepublic:
         self.has_used_tax[player_id] = True
         return True, f"Taxed player {target_id} for ${tax_amount}"
 
+    @_require_turn
     def buy_powder_charge(self, player_id: int) -> Tuple[bool, str]:
         """
         Spend $12 to buy a powder charge, giving the Drow one war victory.
@@ -259,12 +460,8 @@ class AzroksRepublic:
         Returns:
             Tuple of (success, message)
         """
-        if self.state != AzrokGameState.INVESTMENT_PHASE:
-            return False, "Not in investment phase"
-        if player_id != self.get_current_player():
-            return False, "Not your turn"
         if self.money[player_id] < self.POWDER_CHARGE_COST:
-            return False, "Not enough money"
+            return _ERR_NOT_ENOUGH_MONEY
 
         self.money[player_id] -= self.POWDER_CHARGE_COST
         self.war_failures += 1
@@ -278,6 +475,7 @@ class AzroksRepublic:
             f"{self.war_failures}/{self.MAX_WAR_FAILURES}"
         )
 
+    @_require_turn
     def buy_azroks_dagger(self, player_id: int) -> Tuple[bool, str]:
         """
         Spend $14 to recover Azrok's Dagger, winning the game for the Republic.
@@ -288,17 +486,14 @@ class AzroksRepublic:
         Returns:
             Tuple of (success, message)
         """
-        if self.state != AzrokGameState.INVESTMENT_PHASE:
-            return False, "Not in investment phase"
-        if player_id != self.get_current_player():
-            return False, "Not your turn"
         if self.money[player_id] < self.AZROKS_DAGGER_COST:
-            return False, "Not enough money"
+            return _ERR_NOT_ENOUGH_MONEY
 
         self.money[player_id] -= self.AZROKS_DAGGER_COST
         self.state = AzrokGameState.GAME_WON_REPUBLIC
         return True, "Azrok's Dagger recovered! The Republic wins!"
 
+    @_require_turn
     def end_turn(self, player_id: int) -> Tuple[bool, str]:
         """
         End the current player's turn and advance to the next player.
@@ -309,10 +504,6 @@ class AzroksRepublic:
         Returns:
             Tuple of (success, message)
         """
-        if self.state != AzrokGameState.INVESTMENT_PHASE:
-            return False, "Not in investment phase"
-        if player_id != self.get_current_player():
-            return False, "Not your turn"
 
         self.current_turn_index += 1
 
@@ -356,24 +547,28 @@ class AzroksRepublic:
                 return result
 
         # 2) Draw Fruits of Labor card
-        if self.fruits_deck:
-            self.current_fruits_card = self.fruits_deck.pop(0)
+        if self._fruits_idx < len(self.fruits_deck):
+            self.current_fruits_card = self.fruits_deck[self._fruits_idx]
+            self._fruits_idx += 1
         else:
-            self.current_fruits_card = 1.5  # Fallback
+            self.current_fruits_card = self.FALLBACK_FRUITS_CARD
 
-        result["fruits_multiplier"] = self.current_fruits_card
+        num, den = self.current_fruits_card
+        result["fruits_multiplier"] = num / den
         result["pot_before"] = self.people_pot
 
         # 3) Multiply remaining pot (round up)
-        self.people_pot = math.ceil(self.people_pot * self.current_fruits_card)
+        self.people_pot = (self.people_pot * num + den - 1) // den
         result["pot_after_multiply"] = self.people_pot
 
         # 4) Divide among players (round down), remainder stays in pot
-        share = self.people_pot // self.num_players
-        remainder = self.people_pot - (share * self.num_players)
+        share, remainder = divmod(self.people_pot, 4)
 
-        for pid in range(self.num_players):
-            self.money[pid] += share
+        money = self.money
+        money[0] += share
+        money[1] += share
+        money[2] += share
+        money[3] += share
 
         self.people_pot = remainder
         result["share_per_player"] = share
@@ -389,29 +584,29 @@ class AzroksRepublic:
 
         return result
 
-    def get_game_info(self) -> dict:
+    def get_game_info(self) -> Mapping:
         """
-        Get current game information (public state).
+        Get current game information.
+
+        The same read-only view is returned on every call and is updated
+        in place, so copy it if a snapshot needs to outlive the next call.
 
         Returns:
-            Dictionary with game state information.
+            Read-only mapping with game state information.
         """
-        return {
-            "num_players": self.num_players,
-            "current_round": self.current_round,
-            "max_rounds": self.MAX_ROUNDS,
-            "state": self.state.value,
-            "people_pot": self.people_pot,
-            "war_failures": self.war_failures,
-            "max_war_failures": self.MAX_WAR_FAILURES,
-            "war_cost": self.get_war_cost() if self.current_round > 0 else 0,
-            "general_secretary": self.general_secretary,
-            "turn_order": self.turn_order,
-            "current_player": self.get_current_player(),
-            "sectors": self.sectors,
-            "improvement_levels": dict(self.improvement_level),
-            "player_money": dict(self.money),
-        }
+        info = self._info
+        info["current_round"] = self.current_round
+        info["state"] = _STATE_NAMES[self.state]
+        info["people_pot"] = self.people_pot
+        info["war_failures"] = self.war_failures
+        # Nothing is at stake before the first round starts
+        info["war_cost"] = self.get_war_cost() if self.current_round else 0
+        info["general_secretary"] = self.general_secretary
+        info["turn_order"] = self.turn_order
+        info["current_player"] = self.get_current_player()
+        info["improvement_levels"] = list(self.improvement_level)
+        info["player_money"] = list(self.money)
+        return self._info_view
 
     def get_player_info(self, player_id: int) -> dict:
         """
@@ -423,7 +618,7 @@ class AzroksRepublic:
         Returns:
             Dictionary with player-specific information.
         """
-        if player_id not in self.roles:
+        if not 0 <= player_id < len(self.roles):
             return {}
         return {
             "player_id": player_id,
@@ -433,3 +628,204 @@ class AzroksRepublic:
             "improvement_level": self.improvement_level[player_id],
             "salary": self.BASE_SALARY * self.improvement_level[player_id],
         }
+
+
+class BatchAzroksRepublic:
+    """
+    Runs many games of Azrok's Republic side by side for Monte Carlo work.
+
+    State is kept as struct-of-arrays: each field is one flat list across
+    all games, and per-player fields are laid out row-major, so player p of
+    game g lives at index ``g * NUM_PLAYERS + p``. Every phase is one call
+    that loops over all live games, which keeps per-game interpreter
+    overhead to a minimum. Secret roles, turn order and taxes are not
+    modelled; callers drive every player's investments directly.
+    """
+
+    __slots__ = (
+        "n_games", "state", "current_round",
+        "money", "improvement_level", "people_pot", "war_failures",
+        "fruits_decks", "_fruits_idx", "_rng",
+    )
+
+    NUM_PLAYERS = AzroksRepublic.NUM_PLAYERS
+
+    def __init__(self, n_games: int, seed: Optional[int] = None):
+        """
+        Initialize a batch of games.
+
+        Args:
+            n_games: Number of games to run side by side
+            seed: Optional seed for the batch's random draws
+
+        Raises:
+            ValueError: If n_games is not positive
+        """
+        if n_games < 1:
+            raise ValueError(f"Batch needs at least one game, got {n_games}")
+
+        n_slots = n_games * self.NUM_PLAYERS
+        self.n_games = n_games
+        # One AzrokGameState value per game, packed a byte each
+        self.state = bytearray([AzrokGameState.SETUP]) * n_games
+        self.current_round: List[int] = [0] * n_games
+
+        # Per-player state, indexed game * NUM_PLAYERS + player
+        self.money = array("i", [0] * n_slots)
+        self.improvement_level = array("i", [1] * n_slots)
+
+        # Per-game state
+        self.people_pot: List[int] = [0] * n_games
+        self.war_failures: List[int] = [0] * n_games
+
+        self.fruits_decks: List[Tuple[Tuple[int, int], ...]] = [()] * n_games
+        self._fruits_idx: List[int] = [0] * n_games
+        self._rng = random.Random(seed)
+
+    def setup_games(self) -> None:
+        """Shuffle a Fruits of Labor deck for every game."""
+        deck = list(AzroksRepublic.FRUITS_OF_LABOR_DECK)
+        shuffle = self._rng.shuffle
+        for g in range(self.n_games):
+            shuffle(deck)
+            self.fruits_decks[g] = tuple(deck)
+        self._fruits_idx = [0] * self.n_games
+
+    def start_round(self) -> List[bool]:
+        """
+        Start a new round in every game that is ready for one.
+
+        Returns:
+            Per-game flags, True where a round was started.
+        """
+        n = self.NUM_PLAYERS
+        salary = AzroksRepublic.BASE_SALARY
+        ready = (AzrokGameState.SETUP, AzrokGameState.ROUND_END)
+        started = [False] * self.n_games
+
+        for g in range(self.n_games):
+            if self.state[g] not in ready:
+                continue
+            self.current_round[g] += 1
+            if self.current_round[g] > AzroksRepublic.MAX_ROUNDS:
+                self.state[g] = AzrokGameState.GAME_WON_REPUBLIC
+                continue
+            for i in range(g * n, g * n + n):
+                self.money[i] += salary * self.improvement_level[i]
+            self.state[g] = AzrokGameState.INVESTMENT_PHASE
+            started[g] = True
+
+        return started
+
+    def invest_people(self, game_mask: List[bool], player_ids: List[int],
+                      amounts: List[int]) -> List[bool]:
+        """
+        Move money from one player into the people pot in each masked game.
+
+        Args:
+            game_mask: Per-game flags selecting which games act
+            player_ids: Per-game ID of the investing player
+            amounts: Per-game amount to invest
+
+        Returns:
+            Per-game flags, True where the investment was made.
+        """
+        n = self.NUM_PLAYERS
+        done = [False] * self.n_games
+
+        for g in range(self.n_games):
+            if not game_mask[g] or self.state[g] != AzrokGameState.INVESTMENT_PHASE:
+                continue
+            i = g * n + player_ids[g]
+            amount = amounts[g]
+            if not isinstance(amount, int) or amount <= 0 or self.money[i] < amount:
+                continue
+            self.money[i] -= amount
+            self.people_pot[g] += amount
+            done[g] = True
+
+        return done
+
+    def invest_improvement(self, game_mask: List[bool], player_ids: List[int]) -> List[bool]:
+        """
+        Improve one player's labor tools in each masked game.
+
+        Args:
+            game_mask: Per-game flags selecting which games act
+            player_ids: Per-game ID of the investing player
+
+        Returns:
+            Per-game flags, True where the improvement was bought.
+        """
+        n = self.NUM_PLAYERS
+        cost = AzroksRepublic.IMPROVEMENT_COST
+        max_level = AzroksRepublic.MAX_IMPROVEMENT_LEVEL
+        done = [False] * self.n_games
+
+        for g in range(self.n_games):
+            if not game_mask[g] or self.state[g] != AzrokGameState.INVESTMENT_PHASE:
+                continue
+            i = g * n + player_ids[g]
+            if self.money[i] < cost or self.improvement_level[i] >= max_level:
+                continue
+            self.money[i] -= cost
+            self.improvement_level[i] += 1
+            done[g] = True
+
+        return done
+
+    def resolve_round(self) -> List[bool]:
+        """
+        Close investment and resolve the round in every game that is playing.
+
+        Returns:
+            Per-game flags, True where the war was funded this round.
+        """
+        n = self.NUM_PLAYERS
+        war_costs = AzroksRepublic.WAR_COSTS
+        fallback = AzroksRepublic.FALLBACK_FRUITS_CARD
+        playing = (AzrokGameState.INVESTMENT_PHASE, AzrokGameState.RESOLUTION_PHASE)
+        funded = [False] * self.n_games
+
+        for g in range(self.n_games):
+            if self.state[g] not in playing:
+                continue
+
+            pot = self.people_pot[g]
+            war_cost = war_costs[self.current_round[g]]
+            if pot >= war_cost:
+                pot -= war_cost
+                funded[g] = True
+            else:
+                pot = 0
+                self.war_failures[g] += 1
+                if self.war_failures[g] >= AzroksRepublic.MAX_WAR_FAILURES:
+                    self.people_pot[g] = pot
+                    self.state[g] = AzrokGameState.GAME_WON_DROW
+                    continue
+
+            deck = self.fruits_decks[g]
+            idx = self._fruits_idx[g]
+            if idx < len(deck):
+                num, den = deck[idx]
+                self._fruits_idx[g] = idx + 1
+            else:
+                num, den = fallback
+            pot = (pot * num + den - 1) // den
+
+            share = pot // n
+            for i in range(g * n, g * n + n):
+                self.money[i] += share
+            self.people_pot[g] = pot - share * n
+
+            if self.current_round[g] >= AzroksRepublic.MAX_ROUNDS:
+                self.state[g] = AzrokGameState.GAME_WON_REPUBLIC
+            else:
+                self.state[g] = AzrokGameState.ROUND_END
+
+        return funded
+
+    def player_money(self, game: int) -> List[int]:
+        """Get a copy of every player's money in one game."""
+        n = self.NUM_PLAYERS
+        return self.money[game * n:game * n + n].tolist()
@@ -6,10 +6,14 @@ to connected clients via WebSocket messages.
 """
 
 import asyncio
-import json
+import contextlib
+import logging
 import os
-from typing import Dict, Optional, Set, Union
+import struct
+from typing import Callable, Dict, List, Optional, Set, Union
+from weakref import WeakKeyDictionary
 
+import orjson
 import websockets
 from websockets.asyncio.server import ServerConnection
 from websockets.datastructures import Headers
@@ -19,62 +23,322 @@ from the_mind import TheMind, GameState
 from azroks_republic import AzroksRepublic, AzrokGameState
 from team_supreme_scribbles import TeamSupremeScribbles, ScribblesGameState
 
+logger = logging.getLogger(__name__)
+
+
+def _dumps(message: dict) -> bytes:
+    """Serialize a message to JSON bytes; int-keyed dicts are allowed."""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _error(code: str, message: str) -> dict:
+    """Build an error reply with a machine-readable code and a human message."""
+    return {"type": "error", "code": code, "message": message}
+
+
+# Fixed error replies, serialized once
+_ERR_INVALID_JSON = _dumps(_error("INVALID_JSON", "Invalid JSON"))
+_ERR_NOT_IN_ROOM = _dumps(_error("NOT_IN_ROOM", "Not in a room"))
+_ERR_GAME_NOT_STARTED = _dumps(_error("GAME_NOT_STARTED", "Game not started"))
+_ERR_PLAYER_NOT_FOUND = _dumps(_error("PLAYER_NOT_FOUND", "Player not found"))
+_ERR_AMOUNT_REQUIRED = _dumps(_error("AMOUNT_REQUIRED", "Amount required"))
+_ERR_TARGET_REQUIRED = _dumps(_error("TARGET_REQUIRED", "Target ID required"))
+_ERR_WORD_REQUIRED = _dumps(_error("WORD_REQUIRED", "Word is required"))
+_ERR_ROOM_ID_REQUIRED = _dumps(_error("ROOM_ID_REQUIRED", "Room ID is required"))
+_ERR_ROOM_FULL = _dumps(_error("ROOM_FULL", "Room is full"))
+_ERR_CARD_REQUIRED = _dumps(_error("CARD_REQUIRED", "Card value required"))
+
+
+# Binary stroke-batch frame: a one-byte tag, then per stroke the
+# x1, y1, x2, y2 coordinates as little-endian float32, the RGB colour and
+# the brush size
+STROKE_BATCH_TAG = b"\x01"
+_STROKE = struct.Struct("<4f4B")
+
+
+def _pack_stroke(stroke: dict) -> Optional[bytes]:
+    """Pack one client stroke for a binary batch, or None if it does not fit the record.
+
+    Colours must be #rrggbb or the short #rgb form.
+    """
+    try:
+        color = stroke.get("color") or "#000000"
+        if len(color) == 4 and color[0] == "#":
+            color = "#" + "".join(c * 2 for c in color[1:])
+        if len(color) != 7 or color[0] != "#":
+            return None
+        rgb = bytes.fromhex(color[1:])
+        size = min(max(int(stroke.get("size") or 4), 1), 255)
+        return _STROKE.pack(
+            stroke["x1"], stroke["y1"], stroke["x2"], stroke["y2"],
+            rgb[0], rgb[1], rgb[2], size,
+        )
+    except (AttributeError, KeyError, OverflowError, TypeError, ValueError, struct.error):
+        return None
+
+
+def _azrok_player_fields(game: AzroksRepublic, pid: int) -> dict:
+    """Private state fields for one Azrok's Republic player."""
+    pinfo = game.get_player_info(pid)
+    return {
+        "your_role": pinfo.get("role"),
+        "your_sector": pinfo.get("sector"),
+        "your_money": pinfo.get("money"),
+        "your_improvement_level": pinfo.get("improvement_level"),
+        "your_salary": pinfo.get("salary"),
+        "your_id": pid,
+    }
+
+
+def _scribbles_player_fields(game: TeamSupremeScribbles, pid: int) -> dict:
+    """Private state fields for one Team Supreme Scribbles player."""
+    if pid == game.current_drawer:
+        return {"your_id": pid, "your_word": game.get_drawer_info().get("word")}
+    return {"your_id": pid}
+
+
+def _the_mind_player_fields(game: TheMind, pid: int) -> dict:
+    """Private state fields for one player of The Mind."""
+    return {"your_hand": game.get_player_hand(pid), "your_id": pid}
+
+
+# Game type -> builder of each player's private state fields; any other
+# game type is played as The Mind
+_PLAYER_FIELDS: Dict[str, Callable[..., dict]] = {
+    "azroks_republic": _azrok_player_fields,
+    "team_supreme_scribbles": _scribbles_player_fields,
+    "the_mind": _the_mind_player_fields,
+}
+
 
 class GameRoom:
     """Represents a game room where players connect and play."""
 
+    __slots__ = (
+        "room_id", "num_players", "game_type",
+        "players", "player_names", "ws_to_pid", "game",
+        "delta_players", "last_state_per_player", "state_seq", "last_state_sent",
+        "queues", "tasks", "state_slots", "stroke_buffer", "stroke_flush",
+    )
+
+    # Most messages a player's outbox holds before the oldest is dropped
+    OUTBOX_SIZE = 64
+
     def __init__(self, room_id: str, num_players: int, game_type: str = "the_mind"):
         self.room_id = room_id
         self.num_players = num_players
         self.game_type = game_type
         self.players: Dict[int, ServerConnection] = {}
         self.player_names: Dict[int, str] = {}
+        self.ws_to_pid: Dict[ServerConnection, int] = {}
         self.game: Optional[Union[TheMind, AzroksRepublic, TeamSupremeScribbles]] = None
+        # Players who asked for delta game-state updates, with the last
+        # state sent to each and its sequence number
+        self.delta_players: Set[int] = set()
+        self.last_state_per_player: Dict[int, dict] = {}
+        self.state_seq: Dict[int, int] = {}
+        # Last serialized state sent to each full-snapshot player
+        self.last_state_sent: Dict[int, bytes] = {}
+        # Per-player outbox queues, each drained by its own sender task
+        self.queues: Dict[int, asyncio.Queue] = {}
+        self.tasks: Dict[int, asyncio.Task] = {}
+        # Newest unsent full game state per player; the outbox holds a
+        # None placeholder where it will be sent
+        self.state_slots: Dict[int, bytes] = {}
+        # Scribbles strokes waiting to be relayed as one batch
+        self.stroke_buffer: List[bytes] = []
+        self.stroke_flush: Optional[asyncio.TimerHandle] = None
 
     @property
     def is_full(self) -> bool:
         return len(self.players) >= self.num_players
 
-    def add_player(self, name: str, ws: ServerConnection) -> int:
-        """Add a player and return their player_id."""
+    def add_player(self, name: str, ws: ServerConnection, delta: bool = False) -> int:
+        """Add a player and return their player_id.
+
+        Players added with delta=True receive game-state changes as
+        game_state_delta messages after a first full snapshot.
+        """
         player_id = len(self.players)
         self.players[player_id] = ws
         self.player_names[player_id] = name
+        self.ws_to_pid[ws] = player_id
+        if delta:
+            self.delta_players.add(player_id)
         return player_id
 
     def remove_player(self, player_id: int) -> None:
         """Remove a player from the room."""
-        self.players.pop(player_id, None)
+        ws = self.players.pop(player_id, None)
+        if ws is not None and self.ws_to_pid.get(ws) == player_id:
+            del self.ws_to_pid[ws]
         self.player_names.pop(player_id, None)
+        self.delta_players.discard(player_id)
+        self.last_state_per_player.pop(player_id, None)
+        self.state_seq.pop(player_id, None)
+        self.last_state_sent.pop(player_id, None)
+        self.state_slots.pop(player_id, None)
+        task = self.tasks.pop(player_id, None)
+        if task:
+            task.cancel()
+        queue = self.queues.pop(player_id, None)
+        while queue and not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+
+    def enqueue(self, player_id: int, data: Optional[bytes], text: bool = True) -> None:
+        """Queue serialized data for a player without waiting on their socket.
+
+        Data is sent as a text frame of UTF-8 JSON unless text is False.
+        The player's sender task is started on first use. When the outbox
+        is full the oldest message is dropped so the newest gets through,
+        and the player's next game state is sent in full even if unchanged.
+        A pending game state is never dropped: if it is the oldest entry,
+        the next message goes instead and the state moves to the back.
+        """
+        ws = self.players.get(player_id)
+        if ws is None:
+            return
+        queue = self.queues.get(player_id)
+        if queue is None:
+            queue = self.queues[player_id] = asyncio.Queue(maxsize=self.OUTBOX_SIZE)
+            self.tasks[player_id] = asyncio.create_task(self._sender(player_id, ws, queue))
+        if queue.full():
+            dropped = queue.get_nowait()
+            queue.task_done()
+            if dropped is None:
+                # Keep the pending state: drop the next message instead and
+                # requeue the state placeholder behind the rest
+                queue.get_nowait()
+                queue.task_done()
+                queue.put_nowait(None)
+            self.last_state_per_player.pop(player_id, None)
+            self.last_state_sent.pop(player_id, None)
+        queue.put_nowait(None if data is None else (data, text))
+
+    def enqueue_state(self, player_id: int, data: bytes) -> None:
+        """Queue a full game state, replacing any older one not yet sent.
+
+        A client that falls behind gets only the newest snapshot, delivered
+        where the first unsent one was queued.
+        """
+        if player_id not in self.players:
+            return
+        pending = player_id in self.state_slots
+        self.state_slots[player_id] = data
+        if not pending:
+            self.enqueue(player_id, None)
+
+    async def _sender(self, player_id: int, ws: ServerConnection, queue: asyncio.Queue) -> None:
+        """Send a player's queued messages in order until they disconnect.
+
+        Once a send fails, later messages are discarded so the outbox keeps
+        draining. The player is left in the room: closing the connection
+        ends its handler, and handle_disconnect then removes them and tells
+        the others.
+        """
+        failed = False
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    state = self.state_slots.pop(player_id, None)
+                    item = None if state is None else (state, True)
+                if item is not None and not failed:
+                    data, text = item
+                    await ws.send(data, text=text)
+            except websockets.exceptions.ConnectionClosed:
+                failed = True
+            except Exception:
+                logger.exception("Sending to player %s in room %s failed", player_id, self.room_id)
+                failed = True
+                with contextlib.suppress(Exception):
+                    await ws.close()
+            finally:
+                queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been sent."""
+        await asyncio.gather(*(queue.join() for queue in list(self.queues.values())))
 
     def get_player_id(self, ws: ServerConnection) -> Optional[int]:
         """Find the player_id for a given WebSocket connection."""
-        for pid, conn in self.players.items():
-            if conn is ws:
-                return pid
-        return None
+        return self.ws_to_pid.get(ws)
 
 
 class GameServer:
     """Manages game rooms and WebSocket connections."""
 
+    __slots__ = ("rooms", "connection_room")
+
+    # Seconds of drawing gathered into each binary stroke-batch relay
+    STROKE_BATCH_WINDOW = 0.016
+
+    # Client action -> (handler method, game action it forwards to, if any).
+    # Every handler is called as handler(ws, [game_action,] msg).
+    _DISPATCH: Dict[str, tuple[str, ...]] = {
+        "create_room": ("_handle_create_room",),
+        "join_room": ("_handle_join_room",),
+        "play_card": ("_handle_play_card",),
+        "use_star": ("_handle_use_star",),
+        "next_level": ("_handle_next_level",),
+        "list_rooms": ("_handle_list_rooms",),
+        "invest_people": ("_handle_azrok_action", "invest_people"),
+        "invest_improvement": ("_handle_azrok_action", "invest_improvement"),
+        "use_tax": ("_handle_azrok_action", "use_tax"),
+        "buy_powder_charge": ("_handle_azrok_action", "buy_powder_charge"),
+        "buy_azroks_dagger": ("_handle_azrok_action", "buy_azroks_dagger"),
+        "end_turn": ("_handle_azrok_action", "end_turn"),
+        "resolve_round": ("_handle_azrok_action", "resolve_round"),
+        "start_round": ("_handle_azrok_action", "start_round"),
+        "next_round": ("_handle_azrok_action", "start_round"),
+        "scribbles_start_round": ("_handle_scribbles_action", "start_round"),
+        "scribbles_guess": ("_handle_scribbles_action", "guess"),
+        "scribbles_end_drawing": ("_handle_scribbles_action", "end_drawing"),
+        "scribbles_draw": ("_handle_scribbles_draw",),
+        "scribbles_clear": ("_handle_scribbles_clear",),
+    }
+
     def __init__(self):
         self.rooms: Dict[str, GameRoom] = {}
-        self.connection_room: Dict[ServerConnection, str] = {}
+        # Weakly keyed so a connection that skips handle_disconnect is
+        # still released once nothing else refers to it
+        self.connection_room: "WeakKeyDictionary[ServerConnection, str]" = WeakKeyDictionary()
 
     def create_room(self, room_id: str, num_players: int, game_type: str = "the_mind") -> GameRoom:
         """Create a new game room."""
         if room_id in self.rooms:
             raise ValueError(f"Room '{room_id}' already exists")
+        self._check_player_count(num_players, game_type)
+        room = GameRoom(room_id, num_players, game_type)
+        self.rooms[room_id] = room
+        return room
+
+    def create_rooms_bulk(self, specs: List[tuple]) -> List[GameRoom]:
+        """Create several rooms at once from (room_id, num_players[, game_type]) specs.
+
+        Every spec is validated before any room is added, so a bad spec
+        leaves the server unchanged.
+        """
+        seen: Set[str] = set()
+        for room_id, num_players, *game_type in specs:
+            if room_id in self.rooms or room_id in seen:
+                raise ValueError(f"Room '{room_id}' already exists")
+            seen.add(room_id)
+            self._check_player_count(num_players, *game_type)
+        rooms = [GameRoom(*spec) for spec in specs]
+        self.rooms.update({room.room_id: room for room in rooms})
+        return rooms
+
+    @staticmethod
+    def _check_player_count(num_players: int, game_type: str = "the_mind") -> None:
+        """Raise ValueError if a game type cannot be played with num_players."""
         if game_type == "team_supreme_scribbles":
             if num_players < 1:
                 raise ValueError("Number of players must be at least 1")
         else:
             if not 2 <= num_players <= 4:
                 raise ValueError("Number of players must be 2-4")
-        room = GameRoom(room_id, num_players, game_type)
-        self.rooms[room_id] = room
-        return room
 
     def get_room(self, room_id: str) -> Optional[GameRoom]:
         return self.rooms.get(room_id)
@@ -82,26 +346,49 @@ class GameServer:
     def remove_room(self, room_id: str) -> None:
         self.rooms.pop(room_id, None)
 
+    def reset(self) -> None:
+        """Drop every room and connection mapping, cancelling pending sends.
+
+        Connections themselves are left open; this only forgets them.
+        """
+        for room in self.rooms.values():
+            if room.stroke_flush is not None:
+                room.stroke_flush.cancel()
+                room.stroke_flush = None
+            for pid in list(room.players):
+                room.remove_player(pid)
+        self.rooms.clear()
+        self.connection_room.clear()
+
+    async def flush(self) -> None:
+        """Wait until every room's queued messages have been sent."""
+        await asyncio.gather(*(room.flush() for room in list(self.rooms.values())))
+
+    @staticmethod
+    async def _reply(ws: ServerConnection, message: dict) -> None:
+        """Send a message straight to one connection, e.g. an error reply."""
+        await ws.send(_dumps(message), text=True)
+
     async def broadcast(self, room: GameRoom, message: dict) -> None:
-        """Send a message to all players in a room."""
-        data = json.dumps(message)
-        disconnected = []
-        for pid, ws in room.players.items():
-            try:
-                await ws.send(data)
-            except websockets.exceptions.ConnectionClosed:
-                disconnected.append(pid)
-        for pid in disconnected:
-            room.remove_player(pid)
+        """Send a message to all players in a room.
+
+        The message is serialized once and queued on each player's outbox,
+        so a slow client never holds up the others.
+        """
+        data = _dumps(message)
+        for pid in list(room.players):
+            room.enqueue(pid, data)
+
+    def _relay_to_others(self, room: GameRoom, player_id: int, data: bytes, text: bool = True) -> None:
+        """Queue pre-serialized data for everyone in a room except one player."""
+        for pid in list(room.players):
+            if pid != player_id:
+                room.enqueue(pid, data, text)
 
     async def send_to_player(self, room: GameRoom, player_id: int, message: dict) -> None:
-        """Send a message to a specific player."""
-        ws = room.players.get(player_id)
-        if ws:
-            try:
-                await ws.send(json.dumps(message))
-            except websockets.exceptions.ConnectionClosed:
-                room.remove_player(player_id)
+        """Send a message to a specific player via their outbox."""
+        if player_id in room.players:
+            room.enqueue(player_id, _dumps(message))
 
     def _build_game_state(self, room: GameRoom) -> dict:
         """Build the shared game state for broadcasting."""
@@ -115,78 +402,90 @@ class GameServer:
         }
 
     async def send_game_state(self, room: GameRoom) -> None:
-        """Send full game state to all players, including individual info."""
+        """Send game state to all players, including individual info.
+
+        The shared state is serialized once and each player's own fields
+        are spliced onto the end. Players who opted into deltas receive
+        only what changed, and nobody is sent a state identical to the
+        last one they got (e.g. after a failed action).
+        """
         state = self._build_game_state(room)
-        for pid in room.players:
-            player_state = {**state}
-            if room.game:
-                if room.game_type == "azroks_republic":
-                    pinfo = room.game.get_player_info(pid)
-                    player_state["your_role"] = pinfo.get("role")
-                    player_state["your_sector"] = pinfo.get("sector")
-                    player_state["your_money"] = pinfo.get("money")
-                    player_state["your_improvement_level"] = pinfo.get("improvement_level")
-                    player_state["your_salary"] = pinfo.get("salary")
-                    player_state["your_id"] = pid
-                elif room.game_type == "team_supreme_scribbles":
-                    player_state["your_id"] = pid
-                    if pid == room.game.current_drawer:
-                        drawer_info = room.game.get_drawer_info()
-                        player_state["your_word"] = drawer_info.get("word")
-                else:
-                    player_state["your_hand"] = room.game.get_player_hand(pid)
-                    player_state["your_id"] = pid
-            await self.send_to_player(room, pid, player_state)
-
-    async def handle_message(self, ws: ServerConnection, data: str) -> None:
-        """Process an incoming WebSocket message."""
-        try:
-            msg = json.loads(data)
-        except json.JSONDecodeError:
-            await ws.send(json.dumps({"type": "error", "message": "Invalid JSON"}))
-            return
+        player_fields = _PLAYER_FIELDS.get(room.game_type, _the_mind_player_fields)
+        # Serialized shared state without its closing brace
+        shared = _dumps(state)[:-1]
+        for pid in list(room.players):
+            extras = player_fields(room.game, pid) if room.game else {}
+
+            if pid in room.delta_players:
+                update = self._state_update(room, pid, {**state, **extras})
+                if update is not None:
+                    room.enqueue(pid, _dumps(update))
+                continue
+
+            data = shared + b"," + _dumps(extras)[1:] if extras else shared + b"}"
+            if room.last_state_sent.get(pid) != data:
+                room.last_state_sent[pid] = data
+                room.enqueue_state(pid, data)
+
+    @staticmethod
+    def _state_update(room: GameRoom, pid: int, player_state: dict) -> Optional[dict]:
+        """Turn a delta player's full state into the message to send them.
+
+        The player gets a full game_state first and then game_state_delta
+        messages listing only the top-level keys whose values changed or
+        were removed since the previous update. Returns None when nothing
+        changed.
+        """
+        last = room.last_state_per_player.get(pid)
+        if last is not None:
+            changes = {
+                key: value for key, value in player_state.items()
+                if key not in last or last[key] != value
+            }
+            removed = [key for key in last if key not in player_state]
+            if not changes and not removed:
+                return None
+
+        # Shallow-copy containers so later in-place edits (e.g. to
+        # room.player_names) still register as changes
+        room.last_state_per_player[pid] = {
+            key: value.copy() if isinstance(value, (dict, list)) else value
+            for key, value in player_state.items()
+        }
+        seq = room.state_seq.get(pid, -1) + 1
+        room.state_seq[pid] = seq
 
-        action = msg.get("action")
-        if action == "create_room":
-            await self._handle_create_room(ws, msg)
-        elif action == "join_room":
-            await self._handle_join_room(ws, msg)
-        elif action == "play_card":
-            await self._handle_play_card(ws, msg)
-        elif action == "use_star":
-            await self._handle_use_star(ws)
-        elif action == "next_level":
-            await self._handle_next_level(ws)
-        elif action == "list_rooms":
-            await self._handle_list_rooms(ws)
-        elif action == "invest_people":
-            await self._handle_azrok_action(ws, "invest_people", msg)
-        elif action == "invest_improvement":
-            await self._handle_azrok_action(ws, "invest_improvement", msg)
-        elif action == "use_tax":
-            await self._handle_azrok_action(ws, "use_tax", msg)
-        elif action == "buy_powder_charge":
-            await self._handle_azrok_action(ws, "buy_powder_charge", msg)
-        elif action == "buy_azroks_dagger":
-            await self._handle_azrok_action(ws, "buy_azroks_dagger", msg)
-        elif action == "end_turn":
-            await self._handle_azrok_action(ws, "end_turn", msg)
-        elif action == "resolve_round":
-            await self._handle_azrok_action(ws, "resolve_round", msg)
-        elif action in ("start_round", "next_round"):
-            await self._handle_azrok_action(ws, "start_round", msg)
-        elif action == "scribbles_start_round":
-            await self._handle_scribbles_action(ws, "start_round", msg)
-        elif action == "scribbles_guess":
-            await self._handle_scribbles_action(ws, "guess", msg)
-        elif action == "scribbles_end_drawing":
-            await self._handle_scribbles_action(ws, "end_drawing", msg)
-        elif action == "scribbles_draw":
-            await self._handle_scribbles_draw(ws, msg)
-        elif action == "scribbles_clear":
-            await self._handle_scribbles_clear(ws)
+        if last is None:
+            return {**player_state, "seq": seq}
+        return {
+            "type": "game_state_delta",
+            "seq": seq,
+            "changes": changes,
+            "removed": removed,
+        }
+
+    async def handle_message(self, ws: ServerConnection, data: Union[str, bytes, dict]) -> None:
+        """Process an incoming WebSocket message.
+
+        data is a raw frame (text or UTF-8 bytes); in-process callers may
+        pass an already-decoded message dict to skip the JSON round-trip.
+        """
+        if isinstance(data, dict):
+            msg = data
         else:
-            await ws.send(json.dumps({"type": "error", "message": f"Unknown action: {action}"}))
+            try:
+                msg = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                await ws.send(_ERR_INVALID_JSON, text=True)
+                return
+
+        action = msg.get("action")
+        entry = self._DISPATCH.get(action) if isinstance(action, str) else None
+        if entry is None:
+            await self._reply(ws, _error("UNKNOWN_ACTION", f"Unknown action: {action}"))
+            return
+        handler, *game_action = entry
+        await getattr(self, handler)(ws, *game_action, msg)
 
     async def _get_room_and_player(
         self, ws: ServerConnection
@@ -197,15 +496,15 @@ class GameServer:
         """
         room_id = self.connection_room.get(ws)
         if not room_id:
-            await ws.send(json.dumps({"type": "error", "message": "Not in a room"}))
+            await ws.send(_ERR_NOT_IN_ROOM, text=True)
             return None, None, None
         room = self.get_room(room_id)
         if not room or not room.game:
-            await ws.send(json.dumps({"type": "error", "message": "Game not started"}))
+            await ws.send(_ERR_GAME_NOT_STARTED, text=True)
             return None, None, None
         player_id = room.get_player_id(ws)
         if player_id is None:
-            await ws.send(json.dumps({"type": "error", "message": "Player not found"}))
+            await ws.send(_ERR_PLAYER_NOT_FOUND, text=True)
             return None, None, None
         return room, player_id, room_id
 
@@ -218,7 +517,7 @@ class GameServer:
         if action_name == "invest_people":
             amount = msg.get("amount")
             if amount is None:
-                await ws.send(json.dumps({"type": "error", "message": "Amount required"}))
+                await ws.send(_ERR_AMOUNT_REQUIRED, text=True)
                 return
             success, message = room.game.invest_people(player_id, int(amount))
         elif action_name == "invest_improvement":
@@ -226,7 +525,7 @@ class GameServer:
         elif action_name == "use_tax":
             target_id = msg.get("target_id")
             if target_id is None:
-                await ws.send(json.dumps({"type": "error", "message": "Target ID required"}))
+                await ws.send(_ERR_TARGET_REQUIRED, text=True)
                 return
             success, message = room.game.use_tax(player_id, int(target_id))
         elif action_name == "buy_powder_charge":
@@ -254,7 +553,7 @@ class GameServer:
             await self.send_game_state(room)
             return
         else:
-            await ws.send(json.dumps({"type": "error", "message": f"Unknown azrok action: {action_name}"}))
+            await self._reply(ws, _error("UNKNOWN_ACTION", f"Unknown azrok action: {action_name}"))
             return
 
         await self.broadcast(room, {
@@ -285,7 +584,7 @@ class GameServer:
         elif action_name == "guess":
             word = msg.get("word", "")
             if not word:
-                await ws.send(json.dumps({"type": "error", "message": "Word is required"}))
+                await ws.send(_ERR_WORD_REQUIRED, text=True)
                 return
             correct, message = room.game.guess(player_id, word)
             await self.broadcast(room, {
@@ -309,7 +608,7 @@ class GameServer:
             await self.send_game_state(room)
             return
 
-        await ws.send(json.dumps({"type": "error", "message": f"Unknown scribbles action: {action_name}"}))
+        await self._reply(ws, _error("UNKNOWN_ACTION", f"Unknown scribbles action: {action_name}"))
 
     async def _handle_scribbles_draw(self, ws: ServerConnection, msg: dict) -> None:
         """Relay drawing data from the drawer to all other players."""
@@ -325,16 +624,30 @@ class GameServer:
         stroke = msg.get("stroke")
         if stroke is None:
             return
+        packed = _pack_stroke(stroke)
+        if packed is None:
+            # Strokes the binary record cannot hold (e.g. named or rgb()
+            # colours) go out as JSON, after any batch so order is kept
+            if room.stroke_flush is not None:
+                room.stroke_flush.cancel()
+                self._flush_strokes(room, player_id)
+            self._relay_to_others(room, player_id, _dumps({"type": "scribbles_draw", "stroke": stroke}))
+            return
 
-        data = json.dumps({"type": "scribbles_draw", "stroke": stroke})
-        for pid, conn in room.players.items():
-            if pid != player_id:
-                try:
-                    await conn.send(data)
-                except websockets.exceptions.ConnectionClosed:
-                    pass
+        room.stroke_buffer.append(packed)
+        if room.stroke_flush is None:
+            room.stroke_flush = asyncio.get_running_loop().call_later(
+                self.STROKE_BATCH_WINDOW, self._flush_strokes, room, player_id
+            )
+
+    def _flush_strokes(self, room: GameRoom, player_id: int) -> None:
+        """Relay the buffered strokes to everyone but the drawer in one binary frame."""
+        strokes, room.stroke_buffer = room.stroke_buffer, []
+        room.stroke_flush = None
+        if strokes:
+            self._relay_to_others(room, player_id, STROKE_BATCH_TAG + b"".join(strokes), text=False)
 
-    async def _handle_scribbles_clear(self, ws: ServerConnection) -> None:
+    async def _handle_scribbles_clear(self, ws: ServerConnection, msg: dict) -> None:
         """Relay canvas clear from the drawer to all other players."""
         room, player_id, room_id = await self._get_room_and_player(ws)
         if room is None:
@@ -343,13 +656,12 @@ class GameServer:
         if player_id != room.game.current_drawer:
             return
 
-        data = json.dumps({"type": "scribbles_clear"})
-        for pid, conn in room.players.items():
-            if pid != player_id:
-                try:
-                    await conn.send(data)
-                except websockets.exceptions.ConnectionClosed:
-                    pass
+        # Strokes not yet relayed would be wiped by the clear anyway
+        if room.stroke_flush is not None:
+            room.stroke_flush.cancel()
+            room.stroke_flush = None
+        room.stroke_buffer.clear()
+        self._relay_to_others(room, player_id, _dumps({"type": "scribbles_clear"}))
 
     async def _handle_create_room(self, ws: ServerConnection, msg: dict) -> None:
         room_id = msg.get("room_id", "").strip()
@@ -358,19 +670,19 @@ class GameServer:
         game_type = msg.get("game_type", "the_mind").strip()
 
         if not room_id:
-            await ws.send(json.dumps({"type": "error", "message": "Room ID is required"}))
+            await ws.send(_ERR_ROOM_ID_REQUIRED, text=True)
             return
 
         try:
             room = self.create_room(room_id, int(num_players), game_type)
         except ValueError as e:
-            await ws.send(json.dumps({"type": "error", "message": str(e)}))
+            await self._reply(ws, _error("INVALID_ROOM", str(e)))
             return
 
-        player_id = room.add_player(name, ws)
+        player_id = room.add_player(name, ws, delta=bool(msg.get("delta")))
         self.connection_room[ws] = room_id
 
-        await ws.send(json.dumps({
+        await self._reply(ws, {
             "type": "room_joined",
             "room_id": room_id,
             "player_id": player_id,
@@ -378,7 +690,7 @@ class GameServer:
             "num_players": room.num_players,
             "current_players": len(room.players),
             "game_type": room.game_type,
-        }))
+        })
 
     async def _handle_join_room(self, ws: ServerConnection, msg: dict) -> None:
         room_id = msg.get("room_id", "").strip()
@@ -386,17 +698,17 @@ class GameServer:
 
         room = self.get_room(room_id)
         if not room:
-            await ws.send(json.dumps({"type": "error", "message": f"Room '{room_id}' not found"}))
+            await self._reply(ws, _error("ROOM_NOT_FOUND", f"Room '{room_id}' not found"))
             return
 
         if room.is_full:
-            await ws.send(json.dumps({"type": "error", "message": "Room is full"}))
+            await ws.send(_ERR_ROOM_FULL, text=True)
             return
 
-        player_id = room.add_player(name, ws)
+        player_id = room.add_player(name, ws, delta=bool(msg.get("delta")))
         self.connection_room[ws] = room_id
 
-        await ws.send(json.dumps({
+        await self._reply(ws, {
             "type": "room_joined",
             "room_id": room_id,
             "player_id": player_id,
@@ -404,7 +716,7 @@ class GameServer:
             "num_players": room.num_players,
             "current_players": len(room.players),
             "game_type": room.game_type,
-        }))
+        })
 
         await self.broadcast(room, {
             "type": "player_joined",
@@ -434,22 +746,22 @@ class GameServer:
     async def _handle_play_card(self, ws: ServerConnection, msg: dict) -> None:
         room_id = self.connection_room.get(ws)
         if not room_id:
-            await ws.send(json.dumps({"type": "error", "message": "Not in a room"}))
+            await ws.send(_ERR_NOT_IN_ROOM, text=True)
             return
 
         room = self.get_room(room_id)
         if not room or not room.game:
-            await ws.send(json.dumps({"type": "error", "message": "Game not started"}))
+            await ws.send(_ERR_GAME_NOT_STARTED, text=True)
             return
 
         player_id = room.get_player_id(ws)
         if player_id is None:
-            await ws.send(json.dumps({"type": "error", "message": "Player not found"}))
+            await ws.send(_ERR_PLAYER_NOT_FOUND, text=True)
             return
 
         card = msg.get("card")
         if card is None:
-            await ws.send(json.dumps({"type": "error", "message": "Card value required"}))
+            await ws.send(_ERR_CARD_REQUIRED, text=True)
             return
 
         success, message = room.game.play_card(player_id, int(card))
@@ -465,7 +777,7 @@ class GameServer:
 
         await self.send_game_state(room)
 
-    async def _handle_use_star(self, ws: ServerConnection) -> None:
+    async def _handle_use_star(self, ws: ServerConnection, msg: dict) -> None:
         room_id = self.connection_room.get(ws)
         if not room_id:
             return
@@ -489,7 +801,7 @@ class GameServer:
 
         await self.send_game_state(room)
 
-    async def _handle_next_level(self, ws: ServerConnection) -> None:
+    async def _handle_next_level(self, ws: ServerConnection, msg: dict) -> None:
         room_id = self.connection_room.get(ws)
         if not room_id:
             return
@@ -506,7 +818,7 @@ class GameServer:
             })
             await self.send_game_state(room)
 
-    async def _handle_list_rooms(self, ws: ServerConnection) -> None:
+    async def _handle_list_rooms(self, ws: ServerConnection, msg: dict) -> None:
         room_list = []
         for rid, room in self.rooms.items():
             room_list.append({
@@ -516,7 +828,7 @@ class GameServer:
                 "in_progress": room.game is not None,
                 "game_type": room.game_type,
             })
-        await ws.send(json.dumps({"type": "room_list", "rooms": room_list}))
+        await self._reply(ws, {"type": "room_list", "rooms": room_list})
 
     async def handle_disconnect(self, ws: ServerConnection) -> None:
         """Handle a player disconnecting."""
@@ -558,8 +870,25 @@ async def handler(websocket: ServerConnection) -> None:
         await game_server.handle_disconnect(websocket)
 
 
+_STATIC_ROOT = os.path.realpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "static"))
+
+_CONTENT_TYPES = {
+    ".html": "text/html",
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".png": "image/png",
+    ".ico": "image/x-icon",
+}
+
+# (content_type, body) for every static file served so far, keyed by request path
+_STATIC_CACHE: Dict[str, tuple[str, bytes]] = {}
+
+
 def serve_static(connection: ServerConnection, request: Request) -> Response | None:
-    """Serve static files for the web interface."""
+    """Serve static files for the web interface.
+
+    File contents are read once and cached for the life of the process.
+    """
     path = request.path
     if path == "/" or path == "":
         path = "/index.html"
@@ -568,31 +897,32 @@ def serve_static(connection: ServerConnection, request: Request) -> Response | N
     if any(k.lower() == "upgrade" for k in request.headers):
         return None
 
-    static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
-    file_path = os.path.join(static_dir, path.lstrip("/"))
-
-    # Prevent directory traversal
-    file_path = os.path.realpath(file_path)
-    if not file_path.startswith(os.path.realpath(static_dir)):
+    # Prevent directory traversal by rejecting the path outright,
+    # without resolving it on disk
+    rel_path = path.lstrip("/")
+    if ".." in rel_path.split("/") or "\\" in rel_path or os.path.isabs(rel_path):
         headers = Headers()
         return Response(403, "Forbidden", headers, b"Forbidden")
 
-    if os.path.isfile(file_path):
-        content_types = {
-            ".html": "text/html",
-            ".css": "text/css",
-            ".js": "application/javascript",
-            ".png": "image/png",
-            ".ico": "image/x-icon",
-        }
+    # Key by the normalized path so spellings like //a or /./a share one entry
+    key = os.path.normpath(rel_path)
+    cached = _STATIC_CACHE.get(key)
+    if cached is None:
+        file_path = os.path.join(_STATIC_ROOT, key)
+
+        if not os.path.isfile(file_path):
+            return None
+
         ext = os.path.splitext(file_path)[1]
-        content_type = content_types.get(ext, "application/octet-stream")
+        content_type = _CONTENT_TYPES.get(ext, "application/octet-stream")
         with open(file_path, "rb") as f:
             body = f.read()
-        headers = Headers([("Content-Type", content_type)])
-        return Response(200, "OK", headers, body)
+        cached = _STATIC_CACHE[key] = (content_type, body)
 
-    return None
+    # Headers are built per response because the server adds to them
+    content_type, body = cached
+    headers = Headers([("Content-Type", content_type)])
+    return Response(200, "OK", headers, body)
 
 
 async def main(host: str = "0.0.0.0", port: int | None = None) -> None:
@@ -607,6 +937,9 @@ async def main(host: str = "0.0.0.0", port: int | None = None) -> None:
         host,
         port,
         process_request=serve_static,
+        # Messages are small JSON frames shared by a whole room, so
+        # per-connection permessage-deflate costs more than it saves
+        compression=None,
     ) as server:
         await asyncio.Future()  # Run forever
 
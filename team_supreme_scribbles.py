@@ -7,12 +7,14 @@ minimum number of players is 1.
 """
 
 import random
-from typing import Dict, List, Optional, Tuple
-from enum import Enum
+from array import array
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from enum import IntEnum
 
 
 # Work-safe nouns referencing pop culture and funny things in general
-WORD_LIST: List[str] = [
+WORD_LIST: Tuple[str, ...] = (
     # Pop culture icons
     "lightsaber", "hoverboard", "flux capacitor", "infinity gauntlet",
     "magic carpet", "sorting hat", "iron throne", "batmobile",
@@ -36,15 +38,19 @@ WORD_LIST: List[str] = [
     "boomerang", "pirate ship", "time machine", "robot butler",
     "space helmet", "roller coaster", "bunk bed", "hammock",
     "cannon", "catapult", "confetti", "megaphone",
-]
+)
 
 
-class ScribblesGameState(Enum):
+class ScribblesGameState(IntEnum):
     """Enum representing the state of the game."""
-    WAITING = "waiting"
-    DRAWING = "drawing"
-    ROUND_END = "round_end"
-    GAME_OVER = "game_over"
+    WAITING = 0
+    DRAWING = 1
+    ROUND_END = 2
+    GAME_OVER = 3
+
+
+# Wire names for each ScribblesGameState, indexed by its value
+_STATE_NAMES = ("waiting", "drawing", "round_end", "game_over")
 
 
 class TeamSupremeScribbles:
@@ -54,16 +60,30 @@ class TeamSupremeScribbles:
     Manages game state, word selection, drawing rounds, and scoring.
     """
 
+    __slots__ = (
+        "num_players", "num_rounds", "state", "current_round",
+        "current_drawer", "_turn_counter", "current_word",
+        "_current_word_lower", "scores", "_deck", "_deck_idx", "_rng",
+        "_info", "_info_view",
+    )
+
     MIN_PLAYERS = 1
     DEFAULT_ROUNDS = 3
 
-    def __init__(self, num_players: int, num_rounds: int = DEFAULT_ROUNDS):
+    def __init__(
+        self,
+        num_players: int,
+        num_rounds: int = DEFAULT_ROUNDS,
+        seed: Optional[int] = None,
+    ):
         """
         Initialize Team Supreme Scribbles game.
 
         Args:
             num_players: Number of players (minimum 1, no maximum)
             num_rounds: Number of full rotation rounds to play
+            seed: Optional seed for this game's word draws, for
+                reproducible games
 
         Raises:
             ValueError: If number of players is less than 1
@@ -79,10 +99,25 @@ class TeamSupremeScribbles:
         self.state = ScribblesGameState.WAITING
         self.current_round = 0
         self.current_drawer: int = 0
+        # Turns started so far minus one; round and drawer derive from it
+        self._turn_counter = -1
         self.current_word: Optional[str] = None
-        self.scores: Dict[int, int] = {i: 0 for i in range(num_players)}
-        self.used_words: List[str] = []
-        self.word_list: List[str] = WORD_LIST.copy()
+        # Lowercased current_word, computed once per round for guess()
+        self._current_word_lower: Optional[str] = None
+        self.scores = array("i", [0] * num_players)
+        # Every word in WORD_LIST, reshuffled in place at the start of each
+        # cycle; words before _deck_idx have been drawn this cycle
+        self._deck: List[str] = list(WORD_LIST)
+        self._deck_idx = len(self._deck)
+        self._rng = random.Random(seed)
+
+        # Backing dict for get_game_info(); the fixed fields are filled in
+        # once here and the rest are refreshed on each call
+        self._info: dict = {
+            "num_players": num_players,
+            "num_rounds": num_rounds,
+        }
+        self._info_view: Mapping = MappingProxyType(self._info)
 
     def start_round(self) -> dict:
         """
@@ -91,21 +126,115 @@ class TeamSupremeScribbles:
         Returns:
             Dictionary with round info.
         """
-        if self.state == ScribblesGameState.GAME_OVER:
-            return {"success": False, "message": "Game is already over"}
+        handler = self._TRANSITIONS.get((self.state, "start_round"))
+        if handler is None:
+            return {"success": False, "message": self._START_REJECTIONS[self.state]}
+        return handler(self)
+
+    def guess(self, player_id: int, word: str) -> Tuple[bool, str]:
+        """
+        Submit a guess for the current word.
+
+        Args:
+            player_id: ID of the guessing player
+            word: The guessed word
+
+        Returns:
+            Tuple of (correct, message)
+        """
+        handler = self._TRANSITIONS.get((self.state, "guess"))
+        if handler is None:
+            return False, "No round in progress"
+        return handler(self, player_id, word)
 
-        if self.state == ScribblesGameState.DRAWING:
-            return {"success": False, "message": "A round is already in progress"}
+    def end_drawing(self) -> Tuple[bool, str]:
+        """
+        End the current drawing round without a correct guess (time up or skip).
 
-        # Advance round counter when we cycle back to player 0
-        if self.state == ScribblesGameState.WAITING:
-            self.current_drawer = 0
-            self.current_round = 1
-        else:
-            # Move to next drawer
-            self.current_drawer = (self.current_drawer + 1) % self.num_players
-            if self.current_drawer == 0:
-                self.current_round += 1
+        Returns:
+            Tuple of (success, message)
+        """
+        handler = self._TRANSITIONS.get((self.state, "end_drawing"))
+        if handler is None:
+            return False, "No round in progress"
+        return handler(self)
+
+    def get_game_info(self) -> Mapping:
+        """
+        Get current game information (public state).
+
+        The same read-only view is returned on every call and is updated
+        in place, so copy it if a snapshot needs to outlive the next call.
+
+        Returns:
+            Read-only mapping with game state information.
+        """
+        info = self._info
+        info["current_round"] = self.current_round
+        info["state"] = _STATE_NAMES[self.state]
+        info["current_drawer"] = self.current_drawer
+        info["scores"] = list(self.scores)
+        return self._info_view
+
+    def snapshot(self) -> tuple:
+        """
+        Get a compact, immutable view of the changing public state.
+
+        Cheaper than get_game_info for callers that only compare or log
+        successive states.
+
+        Returns:
+            Tuple of (state, current_round, current_drawer, scores).
+        """
+        return (self.state, self.current_round, self.current_drawer, tuple(self.scores))
+
+    def get_rng_state(self) -> tuple:
+        """
+        Get the state of this game's random number generator.
+
+        Returns:
+            Opaque state that set_rng_state() accepts.
+        """
+        return self._rng.getstate()
+
+    def set_rng_state(self, state: tuple) -> None:
+        """
+        Restore this game's random number generator.
+
+        Args:
+            state: A value previously returned by get_rng_state()
+        """
+        self._rng.setstate(state)
+
+    def get_drawer_info(self) -> dict:
+        """
+        Get information for the current drawer (includes the secret word).
+
+        Returns:
+            Dictionary with drawer-specific information.
+        """
+        return {
+            "drawer_id": self.current_drawer,
+            "word": self.current_word,
+        }
+
+    def _pick_word(self) -> str:
+        """Pick a random word from the list, avoiding repeats until all are used."""
+        idx = self._deck_idx
+        if idx == len(self._deck):
+            # Start a new cycle once every word has been used
+            self._rng.shuffle(self._deck)
+            idx = 0
+        self._deck_idx = idx + 1
+        return self._deck[idx]
+
+    def _start_next_round(self) -> dict:
+        """Advance to the next drawer and pick a word, or end the game."""
+        # Move to the next drawer; the round advances each time the drawer
+        # cycles back to player 0
+        self._turn_counter += 1
+        round_index, self.current_drawer = divmod(self._turn_counter, self.num_players)
+        self.current_round = round_index + 1
 
         # Check if all rounds completed
         if self.current_round > self.num_rounds:
@@ -114,11 +243,12 @@ class TeamSupremeScribbles:
                 "success": True,
                 "message": "Game over!",
                 "game_over": True,
-                "final_scores": dict(self.scores),
+                "final_scores": list(self.scores),
             }
 
         # Pick a word
         self.current_word = self._pick_word()
+        self._current_word_lower = self.current_word.lower()
         self.state = ScribblesGameState.DRAWING
 
         return {
@@ -128,30 +258,20 @@ class TeamSupremeScribbles:
             "word": self.current_word,
         }
 
-    def guess(self, player_id: int, word: str) -> Tuple[bool, str]:
-        """
-        Submit a guess for the current word.
-
-        Args:
-            player_id: ID of the guessing player
-            word: The guessed word
-
-        Returns:
-            Tuple of (correct, message)
-        """
-        if self.state != ScribblesGameState.DRAWING:
-            return False, "No round in progress"
-
+    def _guess_word(self, player_id: int, word: str) -> Tuple[bool, str]:
+        """Check a guess while a drawing is in progress."""
         if player_id == self.current_drawer:
             return False, "The drawer cannot guess"
 
-        if player_id not in self.scores:
+        if not 0 <= player_id < self.num_players:
             return False, "Invalid player ID"
 
         if self.current_word is None:
             return False, "No word selected"
 
-        if word.strip().lower() == self.current_word.lower():
+        target = self._current_word_lower
+        # Most guesses arrive already trimmed and lowercase
+        if word == target or word.strip().lower() == target:
             self.scores[player_id] += 1
             self.scores[self.current_drawer] += 1
             self.state = ScribblesGameState.ROUND_END
@@ -159,55 +279,70 @@ class TeamSupremeScribbles:
 
         return False, "Incorrect guess"
 
-    def end_drawing(self) -> Tuple[bool, str]:
-        """
-        End the current drawing round without a correct guess (time up or skip).
-
-        Returns:
-            Tuple of (success, message)
-        """
-        if self.state != ScribblesGameState.DRAWING:
-            return False, "No round in progress"
-
+    def _end_drawing(self) -> Tuple[bool, str]:
+        """End the drawing in progress without a correct guess."""
         word = self.current_word
         self.state = ScribblesGameState.ROUND_END
         return True, f"Round ended. The word was '{word}'"
 
-    def get_game_info(self) -> dict:
-        """
-        Get current game information (public state).
+    # Valid (state, action) pairs; any other pair is rejected up front
+    _TRANSITIONS: Dict[Tuple[ScribblesGameState, str], Callable] = {
+        (ScribblesGameState.WAITING, "start_round"): _start_next_round,
+        (ScribblesGameState.ROUND_END, "start_round"): _start_next_round,
+        (ScribblesGameState.DRAWING, "guess"): _guess_word,
+        (ScribblesGameState.DRAWING, "end_drawing"): _end_drawing,
+    }
+
+    # Why start_round is rejected in the states that have no transition for it
+    _START_REJECTIONS: Dict[ScribblesGameState, str] = {
+        ScribblesGameState.DRAWING: "A round is already in progress",
+        ScribblesGameState.GAME_OVER: "Game is already over",
+    }
+
+
+def simulate_many(
+    n_games: int,
+    num_players: int,
+    num_rounds: int = TeamSupremeScribbles.DEFAULT_ROUNDS,
+    seed: Optional[int] = None,
+) -> array:
+    """
+    Play many games side by side with random guessing, for balance sweeps.
 
-        Returns:
-            Dictionary with game state information.
-        """
-        return {
-            "num_players": self.num_players,
-            "num_rounds": self.num_rounds,
-            "current_round": self.current_round,
-            "state": self.state.value,
-            "current_drawer": self.current_drawer,
-            "scores": dict(self.scores),
-        }
+    Every turn of every game picks one player uniformly at random. A
+    non-drawer guesses the word; picking the drawer means time ran out,
+    so a turn goes unguessed with probability 1/num_players. Only scores
+    are tracked; words are not drawn.
 
-    def get_drawer_info(self) -> dict:
-        """
-        Get information for the current drawer (includes the secret word).
+    Args:
+        n_games: Number of games to simulate
+        num_players: Players per game (minimum 1)
+        num_rounds: Number of full rotation rounds per game
+        seed: Optional seed for reproducible results
 
-        Returns:
-            Dictionary with drawer-specific information.
-        """
-        return {
-            "drawer_id": self.current_drawer,
-            "word": self.current_word,
-        }
+    Returns:
+        Flat scores for every game, with player p of game g at index
+        ``g * num_players + p``.
 
-    def _pick_word(self) -> str:
-        """Pick a random word from the list, avoiding recent repeats."""
-        available = [w for w in self.word_list if w not in self.used_words]
-        if not available:
-            # Reset if we've used all words
-            self.used_words.clear()
-            available = self.word_list.copy()
-        word = random.choice(available)
-        self.used_words.append(word)
-        return word
+    Raises:
+        ValueError: If n_games or num_players is not positive
+    """
+    if n_games < 1:
+        raise ValueError(f"Simulation needs at least one game, got {n_games}")
+    if num_players < TeamSupremeScribbles.MIN_PLAYERS:
+        raise ValueError(
+            f"Team Supreme Scribbles requires at least {TeamSupremeScribbles.MIN_PLAYERS} "
+            f"player, got {num_players}"
+        )
+
+    scores = array("i", [0] * (n_games * num_players))
+    randrange = random.Random(seed).randrange
+    for turn in range(num_rounds * num_players):
+        drawer = turn % num_players
+        for base in range(0, n_games * num_players, num_players):
+            # Rolling the drawer stands for nobody guessing in time
+            guesser = randrange(num_players)
+            if guesser != drawer:
+                scores[base + guesser] += 1
+                scores[base + drawer] += 1
+    return scores
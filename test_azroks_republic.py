@@ -3,7 +3,8 @@ Unit tests for Azrok's Republic game.
 """
 
 import unittest
-from azroks_republic import AzroksRepublic, AzrokGameState
+from array import array
+from azroks_republic import AzroksRepublic, AzrokGameState, BatchAzroksRepublic
 
 
 class TestAzroksRepublicInit(unittest.TestCase):
@@ -17,9 +18,15 @@ class TestAzroksRepublicInit(unittest.TestCase):
         self.assertEqual(game.state, AzrokGameState.SETUP)
         self.assertEqual(game.war_failures, 0)
         self.assertEqual(game.people_pot, 0)
-        for pid in range(4):
-            self.assertEqual(game.money[pid], 0)
-            self.assertEqual(game.improvement_level[pid], 1)
+        self.assertEqual(list(game.money), [0, 0, 0, 0])
+        self.assertEqual(list(game.improvement_level), [1, 1, 1, 1])
+
+    def test_game_has_no_instance_dict(self):
+        """Test that game state lives in slots rather than a __dict__."""
+        game = AzroksRepublic(4)
+        self.assertFalse(hasattr(game, "__dict__"))
+        with self.assertRaises(AttributeError):
+            game.not_a_field = 1
 
     def test_invalid_player_count(self):
         """Test that non-4 player counts raise an error."""
@@ -38,7 +45,7 @@ class TestAzroksRepublicSetup(unittest.TestCase):
         """Test that setup assigns exactly 2 Brothers and 2 Agents."""
         game = AzroksRepublic(4)
         game.setup_game()
-        roles = list(game.roles.values())
+        roles = game.roles
         self.assertEqual(len(roles), 4)
         self.assertEqual(roles.count("Brother of the Republic"), 2)
         self.assertEqual(roles.count("Agent of the Drow"), 2)
@@ -54,6 +61,7 @@ class TestAzroksRepublicSetup(unittest.TestCase):
         game = AzroksRepublic(4)
         game.setup_game()
         self.assertEqual(len(game.fruits_deck), 10)
+        self.assertEqual(sorted(game.fruits_deck), sorted(game.FRUITS_OF_LABOR_DECK))
 
     def test_sectors_assigned(self):
         """Test that sectors are correctly assigned."""
@@ -64,6 +72,37 @@ class TestAzroksRepublicSetup(unittest.TestCase):
         self.assertEqual(game.sectors[3], "Military")
 
 
+class TestAzroksRepublicSeeding(unittest.TestCase):
+    """Test cases for reproducible games."""
+
+    def _play_rounds(self, seed):
+        game = AzroksRepublic(4, seed=seed)
+        game.setup_game()
+        rolls = []
+        for _ in range(game.MAX_ROUNDS):
+            rolls.append(game.start_round()["dice_roll"])
+            game.state = AzrokGameState.ROUND_END
+        return game.roles, game.general_secretary, game.fruits_deck, rolls
+
+    def test_same_seed_same_game(self):
+        """Test that two games with one seed draw identically."""
+        self.assertEqual(self._play_rounds(7), self._play_rounds(7))
+
+    def test_dice_rolls_in_range(self):
+        """Test that every pre-rolled die is a valid position."""
+        rolls = self._play_rounds(3)[3]
+        self.assertTrue(all(1 <= roll <= 4 for roll in rolls))
+
+    def test_clone_continues_same_random_stream(self):
+        """Test that a clone replays the same future draws independently."""
+        game = AzroksRepublic(4, seed=11)
+        twin = game.clone()
+        game.setup_game()
+        twin.setup_game()
+        self.assertEqual(twin.fruits_deck, game.fruits_deck)
+        self.assertEqual(twin.roles, game.roles)
+
+
 class TestAzroksRepublicRounds(unittest.TestCase):
     """Test cases for round mechanics."""
 
@@ -78,8 +117,7 @@ class TestAzroksRepublicRounds(unittest.TestCase):
         result = game.start_round()
         self.assertTrue(result["success"])
         self.assertEqual(game.current_round, 1)
-        for pid in range(4):
-            self.assertEqual(game.money[pid], 2)  # base salary $2 * 1X
+        self.assertEqual(list(game.money), [2, 2, 2, 2])  # base salary $2 * 1X
 
     def test_start_round_salary_with_improvements(self):
         """Test salary scales with improvement level."""
@@ -102,21 +140,23 @@ class TestAzroksRepublicRounds(unittest.TestCase):
         self.assertEqual(len(game.turn_order), 4)
         self.assertEqual(sorted(game.turn_order), [0, 1, 2, 3])
 
+    def test_turn_order_starts_from_dice_roll(self):
+        """Test turn order runs clockwise from the General Secretary."""
+        orders = AzroksRepublic.TURN_ORDERS
+        self.assertEqual(orders[(0, 1)], (0, 1, 2, 3))
+        self.assertEqual(orders[(1, 3)], (3, 0, 1, 2))
+        self.assertEqual(orders[(3, 4)], (2, 3, 0, 1))
+        self.assertEqual(len(orders), 16)
+
     def test_war_cost_scaling(self):
         """Test war cost increases over rounds."""
         game = self._setup_game()
-        game.current_round = 1
-        self.assertEqual(game.get_war_cost(), 4)  # $1 * 4 players
-        game.current_round = 3
-        self.assertEqual(game.get_war_cost(), 4)
-        game.current_round = 4
-        self.assertEqual(game.get_war_cost(), 8)  # $2 * 4 players
-        game.current_round = 6
-        self.assertEqual(game.get_war_cost(), 8)
-        game.current_round = 7
-        self.assertEqual(game.get_war_cost(), 12)  # $3 * 4 players
-        game.current_round = 10
-        self.assertEqual(game.get_war_cost(), 12)
+        # $1, $2 and $3 per player for rounds 1-3, 4-6 and 7-10
+        # Round 0 is priced like round 1; only get_game_info shows it as 0
+        for rnd, expected in [(0, 4), (1, 4), (3, 4), (4, 8), (6, 8), (7, 12), (10, 12)]:
+            with self.subTest(round=rnd):
+                game.current_round = rnd
+                self.assertEqual(game.get_war_cost(), expected)
 
     def test_cannot_start_round_during_investment(self):
         """Test that start_round fails during investment phase."""
@@ -126,21 +166,28 @@ class TestAzroksRepublicRounds(unittest.TestCase):
         self.assertFalse(result["success"])
 
 
+def _game_in_progress():
+    """Create a game in investment phase with known turn order and money."""
+    game = AzroksRepublic(4)
+    game.setup_game()
+    game.general_secretary = 0
+    game.start_round()
+    game.turn_order = [0, 1, 2, 3]
+    game.current_turn_index = 0
+    game.money[:] = array("i", [20] * 4)
+    return game
+
+
 class TestAzroksRepublicInvestments(unittest.TestCase):
     """Test cases for investment actions."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._template = _game_in_progress()
+
     def _setup_game_in_progress(self):
         """Create a game in investment phase with known state."""
-        game = AzroksRepublic(4)
-        game.setup_game()
-        game.general_secretary = 0
-        game.start_round()
-        # Set known turn order and money
-        game.turn_order = [0, 1, 2, 3]
-        game.current_turn_index = 0
-        for pid in range(4):
-            game.money[pid] = 20
-        return game
+        return self._template.clone()
 
     def test_invest_people(self):
         """Test investing money into the People pot."""
@@ -165,6 +212,13 @@ class TestAzroksRepublicInvestments(unittest.TestCase):
         success, msg = game.invest_people(0, 25)
         self.assertFalse(success)
 
+    def test_invest_people_rejects_fractional_amount(self):
+        """Test that a non-integer amount is refused without touching money."""
+        game = self._setup_game_in_progress()
+        self.assertEqual(game.invest_people(0, 2.5), (False, "Amount must be a whole number"))
+        self.assertEqual(game.money[0], 20)
+        self.assertEqual(game.people_pot, 0)
+
     def test_invest_people_wrong_turn(self):
         """Test investing when it's not your turn."""
         game = self._setup_game_in_progress()
@@ -172,6 +226,21 @@ class TestAzroksRepublicInvestments(unittest.TestCase):
         self.assertFalse(success)
         self.assertIn("Not your turn", msg)
 
+    def test_turn_actions_accept_keyword_arguments(self):
+        """Test that guarded actions can still be called with keywords."""
+        game = self._setup_game_in_progress()
+        success, msg = game.invest_people(0, amount=3)
+        self.assertTrue(success)
+        success, msg = game.use_tax(player_id=0, target_id=1)
+        self.assertTrue(success, msg)
+
+    def test_turn_action_accepts_plain_int_state(self):
+        """Test that a state restored as its plain int value still allows turns."""
+        game = self._setup_game_in_progress()
+        game.state = int(game.state)
+        success, msg = game.invest_people(0, 5)
+        self.assertTrue(success)
+
     def test_invest_improvement(self):
         """Test buying a labor improvement."""
         game = self._setup_game_in_progress()
@@ -259,16 +328,13 @@ class TestAzroksRepublicInvestments(unittest.TestCase):
 class TestAzroksRepublicTurnFlow(unittest.TestCase):
     """Test cases for turn flow and phase transitions."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._template = _game_in_progress()
+
     def _setup_game_in_progress(self):
-        game = AzroksRepublic(4)
-        game.setup_game()
-        game.general_secretary = 0
-        game.start_round()
-        game.turn_order = [0, 1, 2, 3]
-        game.current_turn_index = 0
-        for pid in range(4):
-            game.money[pid] = 20
-        return game
+        """Create a game in investment phase with known state."""
+        return self._template.clone()
 
     def test_end_turn_advances_player(self):
         """Test ending a turn advances to the next player."""
@@ -293,6 +359,23 @@ class TestAzroksRepublicTurnFlow(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(game.state, AzrokGameState.RESOLUTION_PHASE)
 
+    def test_actions_rejected_outside_investment_phase(self):
+        """Test that every turn action is refused once investing is over."""
+        game = self._setup_game_in_progress()
+        game.state = AzrokGameState.RESOLUTION_PHASE
+        attempts = [
+            game.invest_people(0, 1),
+            game.invest_improvement(0),
+            game.use_tax(0, 1),
+            game.buy_powder_charge(0),
+            game.buy_azroks_dagger(0),
+            game.end_turn(0),
+        ]
+        for success, msg in attempts:
+            self.assertFalse(success)
+            self.assertEqual(msg, "Not in investment phase")
+        self.assertEqual(game.money[0], 20)
+
     def test_get_current_player(self):
         """Test get_current_player returns correct player."""
         game = self._setup_game_in_progress()
@@ -324,7 +407,7 @@ class TestAzroksRepublicResolution(unittest.TestCase):
         """Test resolution when war fund is met."""
         game = self._setup_game_for_resolution(people_pot=20)
         # Round 1 war cost = $4 (1 * 4 players)
-        game.fruits_deck = [2.0] + game.fruits_deck
+        game.fruits_deck = ((2, 1),) + game.fruits_deck
         result = game.resolve_round()
         self.assertTrue(result["success"])
         self.assertTrue(result["war_funded"])
@@ -344,16 +427,40 @@ class TestAzroksRepublicResolution(unittest.TestCase):
         # War cost for round 1 = $4. Pot after war = $6.
         # Fruits multiplier = 1.5. $6 * 1.5 = $9 (rounded up).
         # $9 / 4 players = $2 each, remainder $1.
-        game.fruits_deck = [1.5] + game.fruits_deck
-        initial_money = {pid: game.money[pid] for pid in range(4)}
+        game.fruits_deck = ((3, 2),) + game.fruits_deck
+        initial_money = list(game.money)
         result = game.resolve_round()
         self.assertEqual(result["pot_before"], 6)
         self.assertEqual(result["pot_after_multiply"], 9)
         self.assertEqual(result["share_per_player"], 2)
         self.assertEqual(result["remainder"], 1)
         self.assertEqual(game.people_pot, 1)
-        for pid in range(4):
-            self.assertEqual(game.money[pid], initial_money[pid] + 2)
+        self.assertEqual(list(game.money), [m + 2 for m in initial_money])
+
+    def test_resolve_round_rounds_pot_up(self):
+        """Test that a fractional multiplied pot is rounded up."""
+        game = self._setup_game_for_resolution(people_pot=11)
+        # Pot after war = $7. $7 * 2.5 = $17.5, rounded up to $18.
+        game.fruits_deck = ((5, 2),) + game.fruits_deck
+        result = game.resolve_round()
+        self.assertEqual(result["fruits_multiplier"], 2.5)
+        self.assertEqual(result["pot_after_multiply"], 18)
+        self.assertEqual(result["share_per_player"], 4)
+        self.assertEqual(result["remainder"], 2)
+
+    def test_resolve_round_draws_cards_in_order(self):
+        """Test that each resolution draws the next Fruits of Labor card."""
+        game = self._setup_game_for_resolution(people_pot=20)
+        game.fruits_deck = ((2, 1), (3, 1))
+        game.resolve_round()
+        self.assertEqual(game.current_fruits_card, (2, 1))
+        game.state = AzrokGameState.RESOLUTION_PHASE
+        game.resolve_round()
+        self.assertEqual(game.current_fruits_card, (3, 1))
+        game.state = AzrokGameState.RESOLUTION_PHASE
+        game.resolve_round()
+        self.assertEqual(game.current_fruits_card, game.FALLBACK_FRUITS_CARD)
+        self.assertEqual(len(game.fruits_deck), 2)
 
     def test_resolve_round_transitions_to_round_end(self):
         """Test that resolution transitions to round end."""
@@ -379,7 +486,7 @@ class TestAzroksRepublicWinConditions(unittest.TestCase):
         game.current_round = 10
         game.state = AzrokGameState.RESOLUTION_PHASE
         game.people_pot = 100
-        game.fruits_deck = [2.0]
+        game.fruits_deck = ((2, 1),)
         result = game.resolve_round()
         self.assertTrue(result.get("game_over"))
         self.assertEqual(result["winner"], "republic")
@@ -434,6 +541,7 @@ class TestAzroksRepublicWinConditions(unittest.TestCase):
         result = game.start_round()
         self.assertTrue(result["success"])
         self.assertEqual(game.state, AzrokGameState.GAME_WON_REPUBLIC)
+        self.assertEqual(game.get_game_info()["war_cost"], 12)
 
 
 class TestAzroksRepublicGameInfo(unittest.TestCase):
@@ -452,6 +560,25 @@ class TestAzroksRepublicGameInfo(unittest.TestCase):
         self.assertIn("people_pot", info)
         self.assertIn("war_failures", info)
         self.assertIn("sectors", info)
+        self.assertEqual(info["player_money"], [2, 2, 2, 2])
+        self.assertEqual(info["improvement_levels"], [1, 1, 1, 1])
+
+    def test_get_game_info_is_read_only_view(self):
+        """Test get_game_info reuses one read-only view that tracks state."""
+        game = AzroksRepublic(4)
+        game.setup_game()
+        info = game.get_game_info()
+        with self.assertRaises(TypeError):
+            info["people_pot"] = 99
+        game.start_round()
+        self.assertIs(game.get_game_info(), info)
+        self.assertEqual(info["current_round"], 1)
+
+    def test_get_game_info_before_first_round(self):
+        """Test war cost is zero before the first round starts."""
+        game = AzroksRepublic(4)
+        game.setup_game()
+        self.assertEqual(game.get_game_info()["war_cost"], 0)
 
     def test_get_player_info(self):
         """Test get_player_info returns role and sector."""
@@ -474,6 +601,146 @@ class TestAzroksRepublicGameInfo(unittest.TestCase):
         self.assertEqual(info, {})
 
 
+class TestAzroksRepublicClone(unittest.TestCase):
+    """Test cases for cloning game state."""
+
+    def test_clone_copies_state(self):
+        """Test that a clone starts out identical to the original."""
+        game = AzroksRepublic(4)
+        game.setup_game()
+        game.start_round()
+        twin = game.clone()
+        self.assertEqual(twin.get_game_info(), game.get_game_info())
+        self.assertEqual(twin.roles, game.roles)
+        self.assertEqual(twin.fruits_deck, game.fruits_deck)
+
+    def test_clone_is_independent(self):
+        """Test that playing on a clone leaves the original untouched."""
+        game = AzroksRepublic(4)
+        game.setup_game()
+        game.start_round()
+        twin = game.clone()
+        current = twin.get_current_player()
+        twin.invest_people(current, 2)
+        twin.use_tax(current, (current + 1) % 4)
+        twin.end_turn(current)
+        self.assertEqual(list(game.money), [2, 2, 2, 2])
+        self.assertEqual(game.people_pot, 0)
+        self.assertEqual(game.has_used_tax, [False] * 4)
+        self.assertEqual(game.current_turn_index, 0)
+        self.assertEqual(twin.current_turn_index, 1)
+
+
+class TestAzroksRepublicStateHash(unittest.TestCase):
+    """Test cases for the Zobrist state hash."""
+
+    def _setup_game(self):
+        game = AzroksRepublic(4)
+        game.setup_game()
+        game.start_round()
+        return game
+
+    def test_equal_states_hash_equal(self):
+        """Test that a clone hashes the same as its original."""
+        game = self._setup_game()
+        self.assertEqual(game.clone().state_hash(), game.state_hash())
+
+    def test_hash_changes_with_state(self):
+        """Test that taking an action changes the hash."""
+        game = self._setup_game()
+        before = game.state_hash()
+        game.invest_people(game.get_current_player(), 1)
+        self.assertNotEqual(game.state_hash(), before)
+
+    def test_hash_ignores_secret_roles(self):
+        """Test that hidden roles do not affect the public state hash."""
+        game = self._setup_game()
+        twin = game.clone()
+        twin.roles = list(reversed(game.roles))
+        self.assertEqual(twin.state_hash(), game.state_hash())
+
+    def test_hash_handles_large_values(self):
+        """Test that values beyond the key tables still hash distinctly."""
+        game = self._setup_game()
+        game.money[0] = 500
+        rich = game.state_hash()
+        game.money[0] = 501
+        self.assertNotEqual(game.state_hash(), rich)
+        self.assertLess(rich, 1 << 64)
+
+
+class TestBatchAzroksRepublic(unittest.TestCase):
+    """Test cases for running many games side by side."""
+
+    def _setup_batch(self, n_games=3):
+        batch = BatchAzroksRepublic(n_games)
+        batch.setup_games()
+        batch.start_round()
+        return batch
+
+    def test_invalid_batch_size(self):
+        """Test that an empty batch is rejected."""
+        with self.assertRaises(ValueError):
+            BatchAzroksRepublic(0)
+
+    def test_start_round_pays_salary(self):
+        """Test that every game starts round 1 with salaries paid."""
+        batch = self._setup_batch()
+        self.assertEqual(batch.current_round, [1, 1, 1])
+        self.assertEqual(list(batch.money), [2] * 12)
+        self.assertTrue(all(s == AzrokGameState.INVESTMENT_PHASE for s in batch.state))
+
+    def test_invest_people_respects_mask(self):
+        """Test that only masked games with enough money invest."""
+        batch = self._setup_batch()
+        done = batch.invest_people([True, False, True], [1, 1, 2], [2, 2, 3])
+        self.assertEqual(done, [True, False, False])
+        self.assertEqual(batch.people_pot, [2, 0, 0])
+        self.assertEqual(batch.player_money(0), [2, 0, 2, 2])
+
+    def test_invest_people_skips_fractional_amount(self):
+        """Test that a non-integer amount leaves that game untouched."""
+        batch = self._setup_batch(1)
+        self.assertEqual(batch.invest_people([True], [0], [1.5]), [False])
+        self.assertEqual(list(batch.money), [2] * 4)
+
+    def test_invest_improvement(self):
+        """Test that improvements cost money and raise the level."""
+        batch = self._setup_batch(1)
+        batch.money[0] = 10
+        self.assertEqual(batch.invest_improvement([True], [0]), [True])
+        self.assertEqual(batch.money[0], 3)
+        self.assertEqual(batch.improvement_level[0], 2)
+
+    def test_resolve_matches_single_game(self):
+        """Test that a batched round resolves like a single game."""
+        batch = self._setup_batch(1)
+        game = AzroksRepublic(4)
+        game.setup_game()
+        game.fruits_deck = batch.fruits_decks[0]
+        game.start_round()
+        for pid in range(4):
+            game.turn_order = [pid]
+            game.current_turn_index = 0
+            game.invest_people(pid, 2)
+            batch.invest_people([True], [pid], [2])
+        game.state = AzrokGameState.RESOLUTION_PHASE
+        game.resolve_round()
+
+        self.assertEqual(batch.resolve_round(), [True])
+        self.assertEqual(batch.player_money(0), list(game.money))
+        self.assertEqual(batch.people_pot[0], game.people_pot)
+        self.assertEqual(batch.state[0], game.state)
+
+    def test_war_failures_end_game(self):
+        """Test that unfunded wars hand the game to the Drow."""
+        batch = self._setup_batch(1)
+        for _ in range(AzroksRepublic.MAX_WAR_FAILURES):
+            self.assertEqual(batch.resolve_round(), [False])
+            batch.start_round()
+        self.assertEqual(batch.state[0], AzrokGameState.GAME_WON_DROW)
+
+
 class TestAzroksRepublicFullGame(unittest.TestCase):
     """Integration test for a full game flow."""
 
@@ -4,36 +4,46 @@ Unit tests for The Mind WebSocket server.
 
 import unittest
 import asyncio
-import json
-from unittest.mock import AsyncMock, MagicMock
+import gc
+import struct
 
-from server import GameServer, GameRoom
-from the_mind import GameState
+import orjson
+from websockets.datastructures import Headers
+from websockets.http11 import Request
+
+try:
+    import uvloop
+except ImportError:  # Optional; the async tests fall back to the stdlib loop
+    uvloop = None
+
+from azroks_republic import AzrokGameState
+from server import GameServer, GameRoom, STROKE_BATCH_TAG, _STATIC_CACHE, serve_static
+from the_mind import GameState, _hand_mask
 
 
 class TestGameRoom(unittest.TestCase):
     """Test cases for the GameRoom class."""
 
     def test_room_creation(self):
-        """Test game room initializes correctly."""
-        room = GameRoom("test-room", 2)
-        self.assertEqual(room.room_id, "test-room")
-        self.assertEqual(room.num_players, 2)
-        self.assertFalse(room.is_full)
-        self.assertIsNone(room.game)
-        self.assertEqual(room.game_type, "the_mind")
-
-    def test_room_creation_with_game_type(self):
-        """Test game room initializes with custom game type."""
-        room = GameRoom("test-room", 3, game_type="ore_wood_offer_letters")
-        self.assertEqual(room.game_type, "ore_wood_offer_letters")
-        self.assertEqual(room.num_players, 3)
+        """Test game room initializes correctly, with and without a game type."""
+        cases = [
+            ((2,), {}, "the_mind"),
+            ((3,), {"game_type": "ore_wood_offer_letters"}, "ore_wood_offer_letters"),
+        ]
+        for args, kwargs, game_type in cases:
+            with self.subTest(game_type=game_type):
+                room = GameRoom("test-room", *args, **kwargs)
+                self.assertEqual(room.room_id, "test-room")
+                self.assertEqual(room.num_players, args[0])
+                self.assertFalse(room.is_full)
+                self.assertIsNone(room.game)
+                self.assertEqual(room.game_type, game_type)
 
     def test_add_player(self):
         """Test adding players to a room."""
         room = GameRoom("test", 2)
-        ws1 = MagicMock()
-        ws2 = MagicMock()
+        ws1 = object()
+        ws2 = object()
 
         pid0 = room.add_player("Alice", ws1)
         self.assertEqual(pid0, 0)
@@ -46,7 +56,7 @@ class TestGameRoom(unittest.TestCase):
     def test_remove_player(self):
         """Test removing a player from a room."""
         room = GameRoom("test", 2)
-        ws = MagicMock()
+        ws = object()
         room.add_player("Alice", ws)
         room.remove_player(0)
         self.assertEqual(len(room.players), 0)
@@ -54,34 +64,53 @@ class TestGameRoom(unittest.TestCase):
     def test_get_player_id(self):
         """Test looking up player ID by WebSocket."""
         room = GameRoom("test", 2)
-        ws1 = MagicMock()
-        ws2 = MagicMock()
+        ws1 = object()
+        ws2 = object()
         room.add_player("Alice", ws1)
         room.add_player("Bob", ws2)
 
         self.assertEqual(room.get_player_id(ws1), 0)
         self.assertEqual(room.get_player_id(ws2), 1)
-        self.assertIsNone(room.get_player_id(MagicMock()))
+        self.assertIsNone(room.get_player_id(object()))
+
+    def test_room_has_no_instance_dict(self):
+        """Test that rooms are slotted and reject unknown attributes."""
+        room = GameRoom("test", 2)
+        self.assertFalse(hasattr(room, "__dict__"))
+        with self.assertRaises(AttributeError):
+            room.spectators = []
+
+    def test_get_player_id_after_remove(self):
+        """Test that a removed player's connection no longer maps to an ID."""
+        room = GameRoom("test", 2)
+        ws = object()
+        room.add_player("Alice", ws)
+        room.remove_player(0)
+        self.assertIsNone(room.get_player_id(ws))
 
 
 class TestGameServer(unittest.TestCase):
     """Test cases for the GameServer class."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.server = GameServer()
+
     def setUp(self):
-        self.server = GameServer()
+        self.server.reset()
 
     def test_create_room(self):
-        """Test creating a game room."""
-        room = self.server.create_room("room1", 2)
-        self.assertIsNotNone(room)
-        self.assertEqual(room.room_id, "room1")
-        self.assertEqual(room.game_type, "the_mind")
-        self.assertIn("room1", self.server.rooms)
-
-    def test_create_room_with_game_type(self):
-        """Test creating a room with a specific game type."""
-        room = self.server.create_room("room1", 2, game_type="ore_wood_offer_letters")
-        self.assertEqual(room.game_type, "ore_wood_offer_letters")
+        """Test creating a game room, with and without a game type."""
+        cases = [
+            ("room1", {}, "the_mind"),
+            ("room2", {"game_type": "ore_wood_offer_letters"}, "ore_wood_offer_letters"),
+        ]
+        for room_id, kwargs, game_type in cases:
+            with self.subTest(game_type=game_type):
+                room = self.server.create_room(room_id, 2, **kwargs)
+                self.assertEqual(room.room_id, room_id)
+                self.assertEqual(room.game_type, game_type)
+                self.assertIs(self.server.rooms[room_id], room)
 
     def test_create_duplicate_room(self):
         """Test creating a room with a duplicate ID raises error."""
@@ -91,10 +120,28 @@ class TestGameServer(unittest.TestCase):
 
     def test_create_room_invalid_players(self):
         """Test creating a room with invalid player count."""
-        with self.assertRaises(ValueError):
-            self.server.create_room("room1", 5)
-        with self.assertRaises(ValueError):
-            self.server.create_room("room1", 1)
+        for num_players in (5, 1):
+            with self.subTest(num_players=num_players):
+                with self.assertRaises(ValueError):
+                    self.server.create_room("room1", num_players)
+
+    def test_create_rooms_bulk(self):
+        """Test creating several rooms in one call."""
+        rooms = self.server.create_rooms_bulk([
+            ("room1", 2),
+            ("room2", 3, "ore_wood_offer_letters"),
+        ])
+        self.assertEqual([r.room_id for r in rooms], ["room1", "room2"])
+        self.assertEqual(rooms[1].game_type, "ore_wood_offer_letters")
+        self.assertIs(self.server.get_room("room2"), rooms[1])
+
+    def test_create_rooms_bulk_is_all_or_nothing(self):
+        """Test that one invalid spec stops every room from being created."""
+        for specs in ([("room1", 2), ("room2", 5)], [("room1", 2), ("room1", 3)]):
+            with self.subTest(specs=specs):
+                with self.assertRaises(ValueError):
+                    self.server.create_rooms_bulk(specs)
+                self.assertEqual(self.server.rooms, {})
 
     def test_get_room(self):
         """Test retrieving a room."""
@@ -102,54 +149,186 @@ class TestGameServer(unittest.TestCase):
         self.assertIsNotNone(self.server.get_room("room1"))
         self.assertIsNone(self.server.get_room("nonexistent"))
 
+    def test_connection_room_does_not_keep_connections_alive(self):
+        """Test that a dropped connection leaves connection_room by itself."""
+        ws = _WSStub()
+        self.server.connection_room[ws] = "room1"
+        del ws
+        gc.collect()
+        self.assertEqual(len(self.server.connection_room), 0)
+
     def test_remove_room(self):
         """Test removing a room."""
         self.server.create_room("room1", 2)
         self.server.remove_room("room1")
         self.assertNotIn("room1", self.server.rooms)
 
+    def test_reset(self):
+        """Test that reset forgets every room and connection."""
+        room = self.server.create_room("room1", 2)
+        ws = _WSStub()
+        room.add_player("Alice", ws)
+        self.server.connection_room[ws] = "room1"
+        self.server.reset()
+        self.assertEqual(self.server.rooms, {})
+        self.assertEqual(len(self.server.connection_room), 0)
+        self.assertEqual(room.players, {})
+
 
-class TestGameServerAsync(unittest.TestCase):
-    """Async test cases for message handling."""
+class TestServeStatic(unittest.TestCase):
+    """Test cases for static file serving."""
 
-    def setUp(self):
-        self.server = GameServer()
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+    def _get(self, path):
+        return serve_static(object(), Request(path, Headers()))
+
+    def test_serves_index(self):
+        """Test that the root path serves index.html as HTML."""
+        response = self._get("/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Type"], "text/html")
+        self.assertIn(b"<html", response.body.lower())
+
+    def test_repeat_requests_get_fresh_headers(self):
+        """Test that cached files still get their own Headers per response."""
+        first = self._get("/index.html")
+        second = self._get("/index.html")
+        self.assertIs(first.body, second.body)
+        self.assertIsNot(first.headers, second.headers)
+
+    def test_path_spellings_share_one_cache_entry(self):
+        """Test that equivalent spellings of a path are cached only once."""
+        _STATIC_CACHE.clear()
+        first = self._get("/index.html")
+        for path in ("//index.html", "/./index.html", "/.//./index.html"):
+            with self.subTest(path=path):
+                self.assertIs(self._get(path).body, first.body)
+        self.assertEqual(list(_STATIC_CACHE), ["index.html"])
+
+    def test_blocks_directory_traversal(self):
+        """Test that paths escaping the static directory are refused."""
+        self.assertEqual(self._get("/../server.py").status_code, 403)
+        self.assertEqual(self._get("/css/../../server.py").status_code, 403)
+        self.assertEqual(self._get("/..\\server.py").status_code, 403)
+
+    def test_missing_file(self):
+        """Test that unknown paths fall through to the WebSocket handler."""
+        self.assertIsNone(self._get("/no-such-file.js"))
+
+
+class _WSStub:
+    """Minimal stand-in for a server connection that records sent frames."""
+
+    # __weakref__ keeps stubs usable as GameServer.connection_room keys
+    __slots__ = ("sent", "__weakref__")
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, data, text=None):
+        self.sent.append((data, text))
+
+
+class _StalledWS(_WSStub):
+    """Connection that records a frame and then never finishes sending it."""
+
+    __slots__ = ("_blocker",)
+
+    def __init__(self):
+        super().__init__()
+        self._blocker = asyncio.Event()
+
+    async def send(self, data, text=None):
+        await super().send(data, text)
+        await self._blocker.wait()
+
+
+class _FailingWS(_WSStub):
+    """Connection whose sends fail, once told to, with an error other than a closed socket."""
+
+    __slots__ = ("failing", "closed")
+
+    def __init__(self):
+        super().__init__()
+        self.failing = False
+        self.closed = False
+
+    async def send(self, data, text=None):
+        if self.failing:
+            raise OSError("boom")
+        await super().send(data, text)
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncServerTestCase(unittest.TestCase):
+    """Base for async server tests; one event loop is shared per class."""
+
+    # Requests used by many tests, passed to handle_message pre-decoded
+    CREATE_GAME1 = {"action": "create_room", "room_id": "game1", "num_players": 2, "name": "Alice"}
+    JOIN_GAME1_BOB = {"action": "join_room", "room_id": "game1", "name": "Bob"}
+    LIST_ROOMS = {"action": "list_rooms"}
+    INVEST_PEOPLE_1 = {"action": "invest_people", "amount": 1}
+    END_TURN = {"action": "end_turn"}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(cls.loop)
+        cls.server = GameServer()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+        asyncio.set_event_loop(None)
 
     def tearDown(self):
-        self.loop.close()
+        self.server.reset()
+        # Let cancelled sender tasks finish before the next test
+        self.loop.run_until_complete(asyncio.sleep(0))
 
     def _run(self, coro):
-        return self.loop.run_until_complete(coro)
+        result = self.loop.run_until_complete(coro)
+        self.loop.run_until_complete(self.server.flush())
+        return result
 
     def _make_ws(self):
-        ws = AsyncMock()
-        ws.send = AsyncMock()
-        return ws
+        return _WSStub()
+
+    def _last_response(self, ws):
+        return orjson.loads(ws.sent[-1][0])
+
+    def _responses(self, ws):
+        return [orjson.loads(data) for data, _ in ws.sent]
+
+    def _action_result(self, ws, action):
+        """Return the first action_result for action sent to ws, or None."""
+        messages = (orjson.loads(data) for data, _ in ws.sent)
+        return next((
+            msg for msg in messages
+            if msg.get("type") == "action_result" and msg.get("action") == action
+        ), None)
+
+
+class TestGameServerAsync(AsyncServerTestCase):
+    """Async test cases for message handling."""
 
     def test_handle_create_room(self):
         """Test creating a room via WebSocket message."""
         ws = self._make_ws()
-        msg = json.dumps({
-            "action": "create_room",
-            "room_id": "game1",
-            "num_players": 2,
-            "name": "Alice"
-        })
-        self._run(self.server.handle_message(ws, msg))
+        self._run(self.server.handle_message(ws, self.CREATE_GAME1))
 
-        ws.send.assert_called_once()
-        response = json.loads(ws.send.call_args[0][0])
+        self.assertEqual(len(ws.sent), 1)
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "room_joined")
         self.assertEqual(response["room_id"], "game1")
         self.assertEqual(response["player_id"], 0)
         self.assertEqual(response["game_type"], "the_mind")
 
     def test_handle_create_room_with_game_type(self):
-        """Test creating a room with game_type via WebSocket message."""
+        """Test creating a room with game_type from a raw JSON frame."""
         ws = self._make_ws()
-        msg = json.dumps({
+        msg = orjson.dumps({
             "action": "create_room",
             "room_id": "game1",
             "num_players": 2,
@@ -158,19 +337,21 @@ class TestGameServerAsync(unittest.TestCase):
         })
         self._run(self.server.handle_message(ws, msg))
 
-        response = json.loads(ws.send.call_args[0][0])
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "room_joined")
         self.assertEqual(response["game_type"], "ore_wood_offer_letters")
 
     def test_handle_list_rooms_includes_game_type(self):
         """Test that room list includes game_type."""
         ws = self._make_ws()
-        self.server.create_room("room1", 2, "the_mind")
-        self.server.create_room("room2", 3, "ore_wood_offer_letters")
+        self.server.create_rooms_bulk([
+            ("room1", 2, "the_mind"),
+            ("room2", 3, "ore_wood_offer_letters"),
+        ])
 
-        self._run(self.server.handle_message(ws, json.dumps({"action": "list_rooms"})))
+        self._run(self.server.handle_message(ws, self.LIST_ROOMS))
 
-        response = json.loads(ws.send.call_args[0][0])
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "room_list")
         self.assertEqual(len(response["rooms"]), 2)
         game_types = {r["room_id"]: r["game_type"] for r in response["rooms"]}
@@ -183,27 +364,24 @@ class TestGameServerAsync(unittest.TestCase):
         ws2 = self._make_ws()
 
         # Create room
-        self._run(self.server.handle_message(ws1, json.dumps({
-            "action": "create_room", "room_id": "game1", "num_players": 2, "name": "Alice"
-        })))
+        self._run(self.server.handle_message(ws1, self.CREATE_GAME1))
 
         # Join room
-        self._run(self.server.handle_message(ws2, json.dumps({
-            "action": "join_room", "room_id": "game1", "name": "Bob"
-        })))
+        self._run(self.server.handle_message(ws2, self.JOIN_GAME1_BOB))
 
         # Should have received room_joined + player_joined + game_started + game_state
-        self.assertTrue(ws2.send.call_count >= 2)
+        self.assertGreaterEqual(len(ws2.sent), 2)
 
     def test_handle_join_nonexistent_room(self):
         """Test joining a room that doesn't exist."""
         ws = self._make_ws()
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "join_room", "room_id": "nope", "name": "Alice"
-        })))
+        }))
 
-        response = json.loads(ws.send.call_args[0][0])
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "error")
+        self.assertEqual(response["code"], "ROOM_NOT_FOUND")
 
     def test_handle_play_card(self):
         """Test playing a card via WebSocket message."""
@@ -211,35 +389,30 @@ class TestGameServerAsync(unittest.TestCase):
         ws2 = self._make_ws()
 
         # Create and fill room
-        self._run(self.server.handle_message(ws1, json.dumps({
-            "action": "create_room", "room_id": "game1", "num_players": 2, "name": "Alice"
-        })))
-        self._run(self.server.handle_message(ws2, json.dumps({
-            "action": "join_room", "room_id": "game1", "name": "Bob"
-        })))
+        self._run(self.server.handle_message(ws1, self.CREATE_GAME1))
+        self._run(self.server.handle_message(ws2, self.JOIN_GAME1_BOB))
 
         # Set up known hands
         room = self.server.get_room("game1")
-        room.game.player_hands = {0: [10], 1: [20]}
-        room.game.played_pile = []
+        room.game._set_table([_hand_mask([10]), _hand_mask([20])])
 
         # Play a card
-        ws1.send.reset_mock()
-        self._run(self.server.handle_message(ws1, json.dumps({
+        ws1.sent.clear()
+        self._run(self.server.handle_message(ws1, {
             "action": "play_card", "card": 10
-        })))
+        }))
 
         # Player 1 should have received messages
-        self.assertTrue(ws1.send.call_count >= 1)
+        self.assertGreaterEqual(len(ws1.sent), 1)
 
     def test_handle_list_rooms(self):
         """Test listing rooms via WebSocket message."""
         ws = self._make_ws()
         self.server.create_room("room1", 2)
 
-        self._run(self.server.handle_message(ws, json.dumps({"action": "list_rooms"})))
+        self._run(self.server.handle_message(ws, self.LIST_ROOMS))
 
-        response = json.loads(ws.send.call_args[0][0])
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "room_list")
         self.assertEqual(len(response["rooms"]), 1)
         self.assertEqual(response["rooms"][0]["room_id"], "room1")
@@ -249,16 +422,132 @@ class TestGameServerAsync(unittest.TestCase):
         ws = self._make_ws()
         self._run(self.server.handle_message(ws, "not json"))
 
-        response = json.loads(ws.send.call_args[0][0])
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "error")
+        self.assertEqual(response["code"], "INVALID_JSON")
 
     def test_handle_unknown_action(self):
         """Test handling unknown action."""
         ws = self._make_ws()
-        self._run(self.server.handle_message(ws, json.dumps({"action": "fly"})))
+        self._run(self.server.handle_message(ws, {"action": "fly"}))
 
-        response = json.loads(ws.send.call_args[0][0])
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "error")
+        self.assertEqual(response["code"], "UNKNOWN_ACTION")
+
+    def test_handle_unhashable_action(self):
+        """Test that a non-string action is reported as unknown."""
+        ws = self._make_ws()
+        self._run(self.server.handle_message(ws, {"action": ["fly"]}))
+
+        response = self._last_response(ws)
+        self.assertEqual(response["type"], "error")
+        self.assertEqual(response["code"], "UNKNOWN_ACTION")
+
+    def test_slow_client_does_not_block_broadcast(self):
+        """Test that a stalled connection does not hold up the others."""
+        room = self.server.create_room("game1", 2)
+        slow = _StalledWS()
+        fast = self._make_ws()
+        room.add_player("Slow", slow)
+        room.add_player("Fast", fast)
+
+        self.loop.run_until_complete(self.server.broadcast(room, {"type": "ping"}))
+        self.loop.run_until_complete(room.queues[1].join())
+        self.assertEqual(len(fast.sent), 1)
+        self.assertEqual(self._last_response(fast), {"type": "ping"})
+
+    def test_failing_send_closes_connection(self):
+        """Test that an unexpected send error closes the socket instead of stalling flush."""
+        room = self.server.create_room("game1", 2)
+        broken = _FailingWS()
+        broken.failing = True
+        room.add_player("Broken", broken)
+        fast = self._make_ws()
+        room.add_player("Fast", fast)
+
+        with self.assertLogs("server", level="ERROR"):
+            for _ in range(2):
+                self.loop.run_until_complete(self.server.broadcast(room, {"type": "ping"}))
+            self.loop.run_until_complete(asyncio.wait_for(self.server.flush(), timeout=1))
+        self.assertTrue(broken.closed)
+        self.assertEqual(len(fast.sent), 2)
+
+    def test_failed_sender_then_disconnect_notifies_and_cleans_up(self):
+        """Test that handle_disconnect still announces and cleans up after a send failure."""
+        broken = _FailingWS()
+        bob = self._make_ws()
+        self._run(self.server.handle_message(broken, {
+            "action": "create_room", "room_id": "game1", "num_players": 3, "name": "Alice"
+        }))
+        self._run(self.server.handle_message(bob, self.JOIN_GAME1_BOB))
+        room = self.server.get_room("game1")
+
+        broken.failing = True
+        with self.assertLogs("server", level="ERROR"):
+            self._run(self.server.broadcast(room, {"type": "ping"}))
+        bob.sent.clear()
+
+        self._run(self.server.handle_disconnect(broken))
+        left = [m for m in self._responses(bob) if m["type"] == "player_left"]
+        self.assertEqual(left, [{"type": "player_left", "player_id": 0, "player_name": "Alice"}])
+
+        self._run(self.server.handle_disconnect(bob))
+        self.assertIsNone(self.server.get_room("game1"))
+
+    def test_full_outbox_drops_oldest(self):
+        """Test that an overflowing outbox keeps the newest messages."""
+        room = self.server.create_room("game1", 2)
+        slow = _StalledWS()
+        room.add_player("Slow", slow)
+
+        async def flood():
+            for i in range(room.OUTBOX_SIZE + 5):
+                room.enqueue(0, str(i).encode())
+
+        self.loop.run_until_complete(flood())
+        # The first five were dropped; the sender is now stuck on "5"
+        self.assertEqual(slow.sent, [(b"5", True)])
+        self.assertEqual(room.queues[0].qsize(), room.OUTBOX_SIZE - 1)
+
+    def test_full_outbox_keeps_pending_state(self):
+        """Test that overflowing the outbox never drops the pending game state."""
+        room = self.server.create_room("game1", 2)
+        slow = _StalledWS()
+        room.add_player("Slow", slow)
+
+        async def flood():
+            room.enqueue(0, b"event")
+            # Let the sender stall on the event, leaving the state oldest
+            await asyncio.sleep(0)
+            room.enqueue_state(0, b"state")
+            for i in range(room.OUTBOX_SIZE + 5):
+                room.enqueue(0, str(i).encode())
+
+        self.loop.run_until_complete(flood())
+        self.assertEqual(room.state_slots[0], b"state")
+
+        # Release the stalled socket and drain the rest of the outbox
+        slow._blocker.set()
+        self.loop.run_until_complete(asyncio.wait_for(room.flush(), timeout=1))
+        self.assertEqual([data for data, _ in slow.sent].count(b"state"), 1)
+        self.assertEqual(slow.sent[-1], (str(room.OUTBOX_SIZE + 4).encode(), True))
+
+    def test_queued_states_collapse_to_latest(self):
+        """Test that unsent game states are replaced by the newest one."""
+        room = self.server.create_room("game1", 2)
+        slow = _StalledWS()
+        room.add_player("Slow", slow)
+
+        async def send_states():
+            room.enqueue(0, b"event")
+            for i in range(3):
+                room.enqueue_state(0, str(i).encode())
+
+        self.loop.run_until_complete(send_states())
+        self.assertEqual(slow.sent, [(b"event", True)])
+        self.assertEqual(room.queues[0].qsize(), 1)
+        self.assertEqual(room.state_slots[0], b"2")
 
     def test_handle_disconnect(self):
         """Test handling player disconnect."""
@@ -266,12 +555,10 @@ class TestGameServerAsync(unittest.TestCase):
         ws2 = self._make_ws()
 
         # Create and join a room
-        self._run(self.server.handle_message(ws1, json.dumps({
+        self._run(self.server.handle_message(ws1, {
             "action": "create_room", "room_id": "game1", "num_players": 3, "name": "Alice"
-        })))
-        self._run(self.server.handle_message(ws2, json.dumps({
-            "action": "join_room", "room_id": "game1", "name": "Bob"
-        })))
+        }))
+        self._run(self.server.handle_message(ws2, self.JOIN_GAME1_BOB))
 
         # Disconnect ws1
         self._run(self.server.handle_disconnect(ws1))
@@ -283,13 +570,29 @@ class TestGameServerAsync(unittest.TestCase):
         self._run(self.server.handle_disconnect(ws2))
         self.assertIsNone(self.server.get_room("game1"))
 
+    def test_concurrent_disconnects_remove_room(self):
+        """Test that players leaving at the same time still remove the room."""
+        ws1 = self._make_ws()
+        ws2 = self._make_ws()
+        self._run(self.server.handle_message(ws1, self.CREATE_GAME1))
+        self._run(self.server.handle_message(ws2, self.JOIN_GAME1_BOB))
+
+        async def disconnect_both():
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.server.handle_disconnect(ws1))
+                tg.create_task(self.server.handle_disconnect(ws2))
+
+        self._run(disconnect_both())
+        self.assertIsNone(self.server.get_room("game1"))
+        self.assertEqual(len(self.server.connection_room), 0)
+
     def test_handle_create_room_empty_id(self):
         """Test creating a room with empty ID."""
         ws = self._make_ws()
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "create_room", "room_id": "", "num_players": 2, "name": "Alice"
-        })))
-        response = json.loads(ws.send.call_args[0][0])
+        }))
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "error")
 
     def test_handle_join_full_room(self):
@@ -298,61 +601,87 @@ class TestGameServerAsync(unittest.TestCase):
         ws2 = self._make_ws()
         ws3 = self._make_ws()
 
-        self._run(self.server.handle_message(ws1, json.dumps({
-            "action": "create_room", "room_id": "game1", "num_players": 2, "name": "Alice"
-        })))
-        self._run(self.server.handle_message(ws2, json.dumps({
-            "action": "join_room", "room_id": "game1", "name": "Bob"
-        })))
-        self._run(self.server.handle_message(ws3, json.dumps({
+        self._run(self.server.handle_message(ws1, self.CREATE_GAME1))
+        self._run(self.server.handle_message(ws2, self.JOIN_GAME1_BOB))
+        self._run(self.server.handle_message(ws3, {
             "action": "join_room", "room_id": "game1", "name": "Charlie"
-        })))
+        }))
 
-        response = json.loads(ws3.send.call_args[0][0])
+        response = self._last_response(ws3)
         self.assertEqual(response["type"], "error")
-        self.assertIn("full", response["message"])
+        self.assertEqual(response["code"], "ROOM_FULL")
 
 
-class TestAzrokServerAsync(unittest.TestCase):
+class TestAzrokServerAsync(AsyncServerTestCase):
     """Async test cases for Azrok's Republic WebSocket handling."""
 
-    def setUp(self):
-        self.server = GameServer()
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-
-    def tearDown(self):
-        self.loop.close()
-
-    def _run(self, coro):
-        return self.loop.run_until_complete(coro)
-
-    def _make_ws(self):
-        ws = AsyncMock()
-        ws.send = AsyncMock()
-        return ws
-
-    def _create_full_azrok_room(self):
+    def _create_full_azrok_room(self, delta=False):
         """Create a room with 4 players and auto-start the game."""
         players = [self._make_ws() for _ in range(4)]
-        self._run(self.server.handle_message(players[0], json.dumps({
+        self._run(self.server.handle_message(players[0], {
             "action": "create_room", "room_id": "azrok1", "num_players": 4,
-            "name": "Alice", "game_type": "azroks_republic"
-        })))
-        for i, name in enumerate(["Bob", "Charlie", "Diana"], start=1):
-            self._run(self.server.handle_message(players[i], json.dumps({
-                "action": "join_room", "room_id": "azrok1", "name": name
-            })))
+            "name": "Alice", "game_type": "azroks_republic", "delta": delta
+        }))
+        self._run(asyncio.gather(*(
+            self.server.handle_message(players[i], {
+                "action": "join_room", "room_id": "azrok1", "name": name, "delta": delta
+            })
+            for i, name in enumerate(["Bob", "Charlie", "Diana"], start=1)
+        )))
         return players
 
+    def test_azrok_delta_updates(self):
+        """Test that delta players get a full snapshot, then only changes."""
+        players = self._create_full_azrok_room(delta=True)
+        full = self._responses(players[0])
+        full = [m for m in full if m.get("type") == "game_state"]
+        self.assertEqual(len(full), 1)
+        self.assertEqual(full[0]["seq"], 0)
+
+        room = self.server.get_room("azrok1")
+        current = room.game.get_current_player()
+        players[0].sent.clear()
+        self._run(self.server.handle_message(players[current], self.INVEST_PEOPLE_1))
+        deltas = self._responses(players[0])
+        deltas = [m for m in deltas if m.get("type") == "game_state_delta"]
+        self.assertEqual(len(deltas), 1)
+        self.assertEqual(deltas[0]["seq"], 1)
+        self.assertEqual(deltas[0]["changes"]["people_pot"], 1)
+        self.assertNotIn("num_players", deltas[0]["changes"])
+        self.assertEqual(deltas[0]["removed"], [])
+
+    def test_azrok_failed_action_sends_no_state(self):
+        """Test that an action that changes nothing does not resend state."""
+        players = self._create_full_azrok_room()
+        room = self.server.get_room("azrok1")
+        current = room.game.get_current_player()
+        players[0].sent.clear()
+        self._run(self.server.handle_message(players[current], {
+            "action": "invest_people", "amount": 1000
+        }))
+        types = [m.get("type") for m in self._responses(players[0])]
+        self.assertIn("action_result", types)
+        self.assertNotIn("game_state", types)
+
+    def test_azrok_full_updates_without_delta(self):
+        """Test that players who did not opt in keep getting full states."""
+        players = self._create_full_azrok_room()
+        room = self.server.get_room("azrok1")
+        current = room.game.get_current_player()
+        players[0].sent.clear()
+        self._run(self.server.handle_message(players[current], self.INVEST_PEOPLE_1))
+        types = [m.get("type") for m in self._responses(players[0])]
+        self.assertIn("game_state", types)
+        self.assertNotIn("game_state_delta", types)
+
     def test_create_azrok_room(self):
         """Test creating an Azrok's Republic room via WebSocket."""
         ws = self._make_ws()
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "create_room", "room_id": "azrok1", "num_players": 4,
             "name": "Alice", "game_type": "azroks_republic"
-        })))
-        response = json.loads(ws.send.call_args[0][0])
+        }))
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "room_joined")
         self.assertEqual(response["game_type"], "azroks_republic")
 
@@ -367,8 +696,7 @@ class TestAzrokServerAsync(unittest.TestCase):
         """Test that game state includes player role info."""
         players = self._create_full_azrok_room()
         # Find a game_state message sent to player 0
-        for call in players[0].send.call_args_list:
-            msg = json.loads(call[0][0])
+        for msg in self._responses(players[0]):
             if msg.get("type") == "game_state" and "your_role" in msg:
                 self.assertIn(msg["your_role"], [
                     "Brother of the Republic", "Agent of the Drow"
@@ -385,19 +713,13 @@ class TestAzrokServerAsync(unittest.TestCase):
         room = self.server.get_room("azrok1")
         current = room.game.get_current_player()
         ws = players[current]
-        ws.send.reset_mock()
+        ws.sent.clear()
 
-        self._run(self.server.handle_message(ws, json.dumps({
-            "action": "invest_people", "amount": 1
-        })))
+        self._run(self.server.handle_message(ws, self.INVEST_PEOPLE_1))
         # Should receive action_result + game_state
-        found_result = False
-        for call in ws.send.call_args_list:
-            msg = json.loads(call[0][0])
-            if msg.get("type") == "action_result" and msg.get("action") == "invest_people":
-                self.assertTrue(msg["success"])
-                found_result = True
-        self.assertTrue(found_result)
+        msg = self._action_result(ws, "invest_people")
+        self.assertIsNotNone(msg)
+        self.assertTrue(msg["success"])
 
     def test_azrok_end_turn(self):
         """Test ending a turn via WebSocket."""
@@ -405,18 +727,12 @@ class TestAzrokServerAsync(unittest.TestCase):
         room = self.server.get_room("azrok1")
         current = room.game.get_current_player()
         ws = players[current]
-        ws.send.reset_mock()
-
-        self._run(self.server.handle_message(ws, json.dumps({
-            "action": "end_turn"
-        })))
-        found_result = False
-        for call in ws.send.call_args_list:
-            msg = json.loads(call[0][0])
-            if msg.get("type") == "action_result" and msg.get("action") == "end_turn":
-                self.assertTrue(msg["success"])
-                found_result = True
-        self.assertTrue(found_result)
+        ws.sent.clear()
+
+        self._run(self.server.handle_message(ws, self.END_TURN))
+        msg = self._action_result(ws, "end_turn")
+        self.assertIsNotNone(msg)
+        self.assertTrue(msg["success"])
 
     def test_azrok_resolve_and_next_round(self):
         """Test resolving a round and starting next round via WebSocket."""
@@ -426,41 +742,30 @@ class TestAzrokServerAsync(unittest.TestCase):
         # End all 4 turns to reach resolution
         for _ in range(4):
             current = room.game.get_current_player()
-            self._run(self.server.handle_message(players[current], json.dumps({
-                "action": "end_turn"
-            })))
+            self._run(self.server.handle_message(players[current], self.END_TURN))
 
-        from azroks_republic import AzrokGameState
         self.assertEqual(room.game.state, AzrokGameState.RESOLUTION_PHASE)
 
         # Resolve round
         ws = players[0]
-        ws.send.reset_mock()
-        self._run(self.server.handle_message(ws, json.dumps({
+        ws.sent.clear()
+        self._run(self.server.handle_message(ws, {
             "action": "resolve_round"
-        })))
-        found = False
-        for call in ws.send.call_args_list:
-            msg = json.loads(call[0][0])
-            if msg.get("type") == "action_result" and msg.get("action") == "resolve_round":
-                self.assertTrue(msg["result"]["success"])
-                found = True
-        self.assertTrue(found)
+        }))
+        msg = self._action_result(ws, "resolve_round")
+        self.assertIsNotNone(msg)
+        self.assertTrue(msg["result"]["success"])
 
         self.assertEqual(room.game.state, AzrokGameState.ROUND_END)
 
         # Start next round
-        ws.send.reset_mock()
-        self._run(self.server.handle_message(ws, json.dumps({
+        ws.sent.clear()
+        self._run(self.server.handle_message(ws, {
             "action": "start_round"
-        })))
-        found = False
-        for call in ws.send.call_args_list:
-            msg = json.loads(call[0][0])
-            if msg.get("type") == "action_result" and msg.get("action") == "start_round":
-                self.assertTrue(msg["result"]["success"])
-                found = True
-        self.assertTrue(found)
+        }))
+        msg = self._action_result(ws, "start_round")
+        self.assertIsNotNone(msg)
+        self.assertTrue(msg["result"]["success"])
 
     def test_azrok_invest_people_missing_amount(self):
         """Test invest_people without amount returns error."""
@@ -468,14 +773,14 @@ class TestAzrokServerAsync(unittest.TestCase):
         room = self.server.get_room("azrok1")
         current = room.game.get_current_player()
         ws = players[current]
-        ws.send.reset_mock()
+        ws.sent.clear()
 
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "invest_people"
-        })))
-        response = json.loads(ws.send.call_args[0][0])
+        }))
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "error")
-        self.assertIn("Amount", response["message"])
+        self.assertEqual(response["code"], "AMOUNT_REQUIRED")
 
     def test_azrok_use_tax_missing_target(self):
         """Test use_tax without target_id returns error."""
@@ -483,56 +788,40 @@ class TestAzrokServerAsync(unittest.TestCase):
         room = self.server.get_room("azrok1")
         current = room.game.get_current_player()
         ws = players[current]
-        ws.send.reset_mock()
+        ws.sent.clear()
 
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "use_tax"
-        })))
-        response = json.loads(ws.send.call_args[0][0])
+        }))
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "error")
-        self.assertIn("Target", response["message"])
+        self.assertEqual(response["code"], "TARGET_REQUIRED")
 
 
-class TestScribblesServerAsync(unittest.TestCase):
+class TestScribblesServerAsync(AsyncServerTestCase):
     """Async test cases for Team Supreme Scribbles WebSocket handling."""
 
-    def setUp(self):
-        self.server = GameServer()
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-
-    def tearDown(self):
-        self.loop.close()
-
-    def _run(self, coro):
-        return self.loop.run_until_complete(coro)
-
-    def _make_ws(self):
-        ws = AsyncMock()
-        ws.send = AsyncMock()
-        return ws
-
     def _create_full_scribbles_room(self, num_players=2):
         """Create a room with the specified number of players and auto-start."""
         players = [self._make_ws() for _ in range(num_players)]
-        self._run(self.server.handle_message(players[0], json.dumps({
+        self._run(self.server.handle_message(players[0], {
             "action": "create_room", "room_id": "scrib1", "num_players": num_players,
             "name": "Alice", "game_type": "team_supreme_scribbles"
-        })))
+        }))
         for i in range(1, num_players):
-            self._run(self.server.handle_message(players[i], json.dumps({
+            self._run(self.server.handle_message(players[i], {
                 "action": "join_room", "room_id": "scrib1", "name": f"Player{i}"
-            })))
+            }))
         return players
 
     def test_create_scribbles_room(self):
         """Test creating a Team Supreme Scribbles room via WebSocket."""
         ws = self._make_ws()
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "create_room", "room_id": "scrib1", "num_players": 3,
             "name": "Alice", "game_type": "team_supreme_scribbles"
-        })))
-        response = json.loads(ws.send.call_args[0][0])
+        }))
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "room_joined")
         self.assertEqual(response["game_type"], "team_supreme_scribbles")
 
@@ -549,8 +838,7 @@ class TestScribblesServerAsync(unittest.TestCase):
         room = self.server.get_room("scrib1")
         drawer_id = room.game.current_drawer
         # Check that the drawer received the word
-        for call in players[drawer_id].send.call_args_list:
-            msg = json.loads(call[0][0])
+        for msg in self._responses(players[drawer_id]):
             if msg.get("type") == "game_state" and "your_word" in msg:
                 self.assertIsNotNone(msg["your_word"])
                 return
@@ -563,18 +851,14 @@ class TestScribblesServerAsync(unittest.TestCase):
         word = room.game.current_word
         guesser_id = 1 if room.game.current_drawer == 0 else 0
         ws = players[guesser_id]
-        ws.send.reset_mock()
+        ws.sent.clear()
 
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "scribbles_guess", "word": word
-        })))
-        found = False
-        for call in ws.send.call_args_list:
-            msg = json.loads(call[0][0])
-            if msg.get("type") == "action_result" and msg.get("action") == "scribbles_guess":
-                self.assertTrue(msg["correct"])
-                found = True
-        self.assertTrue(found)
+        }))
+        msg = self._action_result(ws, "scribbles_guess")
+        self.assertIsNotNone(msg)
+        self.assertTrue(msg["correct"])
 
     def test_scribbles_guess_incorrect(self):
         """Test submitting an incorrect guess via WebSocket."""
@@ -582,44 +866,121 @@ class TestScribblesServerAsync(unittest.TestCase):
         room = self.server.get_room("scrib1")
         guesser_id = 1 if room.game.current_drawer == 0 else 0
         ws = players[guesser_id]
-        ws.send.reset_mock()
+        ws.sent.clear()
 
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "scribbles_guess", "word": "definitely_wrong_xyz"
-        })))
-        found = False
-        for call in ws.send.call_args_list:
-            msg = json.loads(call[0][0])
-            if msg.get("type") == "action_result" and msg.get("action") == "scribbles_guess":
-                self.assertFalse(msg["correct"])
-                found = True
-        self.assertTrue(found)
+        }))
+        msg = self._action_result(ws, "scribbles_guess")
+        self.assertIsNotNone(msg)
+        self.assertFalse(msg["correct"])
 
     def test_scribbles_end_drawing(self):
         """Test ending a drawing round via WebSocket."""
         players = self._create_full_scribbles_room(2)
         ws = players[0]
-        ws.send.reset_mock()
+        ws.sent.clear()
 
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "scribbles_end_drawing"
-        })))
-        found = False
-        for call in ws.send.call_args_list:
-            msg = json.loads(call[0][0])
-            if msg.get("type") == "action_result" and msg.get("action") == "scribbles_end_drawing":
-                self.assertTrue(msg["success"])
-                found = True
-        self.assertTrue(found)
+        }))
+        msg = self._action_result(ws, "scribbles_end_drawing")
+        self.assertIsNotNone(msg)
+        self.assertTrue(msg["success"])
+
+    def test_scribbles_draw_relayed_to_others(self):
+        """Test that strokes from the drawer reach only the other players, batched."""
+        players = self._create_full_scribbles_room(3)
+        room = self.server.get_room("scrib1")
+        drawer = players[room.game.current_drawer]
+        for ws in players:
+            ws.sent.clear()
+
+        strokes = [
+            {"x1": 0, "y1": 0, "x2": 5, "y2": 5, "color": "#ff8000", "size": 4},
+            {"x1": 5, "y1": 5, "x2": 9, "y2": 9, "color": "#000000", "size": 12},
+        ]
+        for stroke in strokes:
+            self._run(self.server.handle_message(drawer, {
+                "action": "scribbles_draw", "stroke": stroke
+            }))
+        self._run(asyncio.sleep(GameServer.STROKE_BATCH_WINDOW * 2))
+
+        self.assertEqual(drawer.sent, [])
+        for pid, ws in enumerate(players):
+            if pid != room.game.current_drawer:
+                self.assertEqual(len(ws.sent), 1)
+                data, text = ws.sent[0]
+                self.assertFalse(text)
+                self.assertEqual(data[:1], STROKE_BATCH_TAG)
+                self.assertEqual(list(struct.iter_unpack("<4f4B", data[1:])), [
+                    (0.0, 0.0, 5.0, 5.0, 0xff, 0x80, 0x00, 4),
+                    (5.0, 5.0, 9.0, 9.0, 0, 0, 0, 12),
+                ])
+
+    def test_scribbles_short_hex_colour_packed(self):
+        """Test that a #rgb colour is expanded into the binary record."""
+        players = self._create_full_scribbles_room(2)
+        room = self.server.get_room("scrib1")
+        drawer_id = room.game.current_drawer
+        guesser = players[1 - drawer_id]
+        guesser.sent.clear()
+
+        self._run(self.server.handle_message(players[drawer_id], {
+            "action": "scribbles_draw",
+            "stroke": {"x1": 0, "y1": 0, "x2": 1, "y2": 1, "color": "#f80", "size": 2},
+        }))
+        self._run(asyncio.sleep(GameServer.STROKE_BATCH_WINDOW * 2))
+        data, text = guesser.sent[0]
+        self.assertFalse(text)
+        self.assertEqual(struct.unpack("<4f4B", data[1:]), (0.0, 0.0, 1.0, 1.0, 0xff, 0x88, 0x00, 2))
+
+    def test_scribbles_unpackable_stroke_relayed_as_json(self):
+        """Test that strokes the binary record cannot hold fall back to JSON, in order."""
+        players = self._create_full_scribbles_room(2)
+        room = self.server.get_room("scrib1")
+        drawer_id = room.game.current_drawer
+        guesser = players[1 - drawer_id]
+        guesser.sent.clear()
+
+        named = {"x1": 1, "y1": 1, "x2": 2, "y2": 2, "color": "red", "size": 4}
+        for stroke in ({"x1": 0, "y1": 0, "x2": 1, "y2": 1, "color": "#000000"}, named):
+            self._run(self.server.handle_message(players[drawer_id], {
+                "action": "scribbles_draw", "stroke": stroke
+            }))
+        self._run(asyncio.sleep(GameServer.STROKE_BATCH_WINDOW * 2))
+
+        self.assertEqual(len(guesser.sent), 2)
+        self.assertEqual(guesser.sent[0][0][:1], STROKE_BATCH_TAG)
+        self.assertEqual(orjson.loads(guesser.sent[1][0]), {"type": "scribbles_draw", "stroke": named})
+
+    def test_scribbles_clear_drops_pending_strokes(self):
+        """Test that a clear discards strokes still waiting to be relayed."""
+        players = self._create_full_scribbles_room(2)
+        room = self.server.get_room("scrib1")
+        drawer_id = room.game.current_drawer
+        guesser = players[1 - drawer_id]
+        guesser.sent.clear()
+
+        self._run(self.server.handle_message(players[drawer_id], {
+            "action": "scribbles_draw", "stroke": {"x1": 0, "y1": 0, "x2": 1, "y2": 1, "color": "#000000"}
+        }))
+        self._run(self.server.handle_message(players[drawer_id], {
+            "action": "scribbles_clear"
+        }))
+        self._run(asyncio.sleep(GameServer.STROKE_BATCH_WINDOW * 2))
+
+        types = [m["type"] for m in self._responses(guesser)]
+        self.assertEqual(types, ["scribbles_clear"])
 
     def test_scribbles_single_player_room(self):
         """Test that a single-player room can be created."""
         ws = self._make_ws()
-        self._run(self.server.handle_message(ws, json.dumps({
+        self._run(self.server.handle_message(ws, {
             "action": "create_room", "room_id": "solo1", "num_players": 1,
             "name": "Solo", "game_type": "team_supreme_scribbles"
-        })))
-        response = json.loads(ws.send.call_args[0][0])
+        }))
+        response = self._last_response(ws)
         self.assertEqual(response["type"], "room_joined")
         self.assertEqual(response["num_players"], 1)
 
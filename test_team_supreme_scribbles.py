@@ -7,48 +7,44 @@ from team_supreme_scribbles import (
     TeamSupremeScribbles,
     ScribblesGameState,
     WORD_LIST,
+    simulate_many,
 )
 
+WORD_SET = frozenset(WORD_LIST)
 
-class TestTeamSupremeScribblesInit(unittest.TestCase):
-    """Test cases for game initialization."""
-
-    def test_game_initialization(self):
-        """Test game initializes with correct default values."""
-        game = TeamSupremeScribbles(num_players=4)
-        self.assertEqual(game.num_players, 4)
-        self.assertEqual(game.num_rounds, 3)
-        self.assertEqual(game.current_round, 0)
-        self.assertEqual(game.state, ScribblesGameState.WAITING)
-        self.assertIsNone(game.current_word)
-        for pid in range(4):
-            self.assertEqual(game.scores[pid], 0)
-
-    def test_single_player_allowed(self):
-        """Test that a single player game is valid."""
-        game = TeamSupremeScribbles(num_players=1)
-        self.assertEqual(game.num_players, 1)
 
-    def test_large_player_count_allowed(self):
-        """Test that there is no upper player cap."""
-        game = TeamSupremeScribbles(num_players=100)
-        self.assertEqual(game.num_players, 100)
-        self.assertEqual(len(game.scores), 100)
+def _started_game(num_players=2):
+    """Create a game with its first drawing round already started."""
+    game = TeamSupremeScribbles(num_players=num_players)
+    game.start_round()
+    return game
 
-    def test_zero_players_raises_error(self):
-        """Test that 0 players raises ValueError."""
-        with self.assertRaises(ValueError):
-            TeamSupremeScribbles(num_players=0)
 
-    def test_negative_players_raises_error(self):
-        """Test that negative player count raises ValueError."""
-        with self.assertRaises(ValueError):
-            TeamSupremeScribbles(num_players=-1)
+class TestTeamSupremeScribblesInit(unittest.TestCase):
+    """Test cases for game initialization."""
 
-    def test_custom_rounds(self):
-        """Test custom number of rounds."""
-        game = TeamSupremeScribbles(num_players=2, num_rounds=5)
-        self.assertEqual(game.num_rounds, 5)
+    def test_init_matrix(self):
+        """Test games initialize correctly across player and round counts."""
+        # (num_players, num_rounds); None keeps the default round count
+        for num_players, num_rounds in [(4, None), (1, None), (100, None), (2, 5)]:
+            with self.subTest(num_players=num_players, num_rounds=num_rounds):
+                if num_rounds is None:
+                    game = TeamSupremeScribbles(num_players=num_players)
+                else:
+                    game = TeamSupremeScribbles(num_players=num_players, num_rounds=num_rounds)
+                self.assertEqual(game.num_players, num_players)
+                self.assertEqual(game.num_rounds, num_rounds or 3)
+                self.assertEqual(game.current_round, 0)
+                self.assertEqual(game.state, ScribblesGameState.WAITING)
+                self.assertIsNone(game.current_word)
+                self.assertEqual(list(game.scores), [0] * num_players)
+
+    def test_too_few_players_raises_error(self):
+        """Test that zero or negative player counts raise ValueError."""
+        for num_players in (0, -1):
+            with self.subTest(num_players=num_players):
+                with self.assertRaises(ValueError):
+                    TeamSupremeScribbles(num_players=num_players)
 
 
 class TestTeamSupremeScribblesWordList(unittest.TestCase):
@@ -60,9 +56,44 @@ class TestTeamSupremeScribblesWordList(unittest.TestCase):
 
     def test_words_are_strings(self):
         """Test all words are non-empty strings."""
-        for word in WORD_LIST:
-            self.assertIsInstance(word, str)
-            self.assertGreater(len(word.strip()), 0)
+        bad = [w for w in WORD_LIST if not isinstance(w, str) or not w.strip()]
+        self.assertEqual(bad, [], f"bad words: {bad}")
+
+
+class TestTeamSupremeScribblesWordPicking(unittest.TestCase):
+    """Test cases for drawing words from the pool."""
+
+    def test_no_repeats_until_exhausted(self):
+        """Test that every word is used once before any repeats."""
+        game = TeamSupremeScribbles(num_players=1)
+        picked = [game._pick_word() for _ in range(len(WORD_LIST))]
+        self.assertEqual(sorted(picked), sorted(WORD_LIST))
+
+    def test_pool_refills_after_exhaustion(self):
+        """Test that picking continues after the pool runs out."""
+        game = TeamSupremeScribbles(num_players=1)
+        for _ in range(len(WORD_LIST)):
+            game._pick_word()
+        self.assertIn(game._pick_word(), WORD_SET)
+
+    def test_same_seed_same_words(self):
+        """Test that two games with one seed pick the same words."""
+        first = TeamSupremeScribbles(num_players=1, seed=5)
+        second = TeamSupremeScribbles(num_players=1, seed=5)
+        self.assertEqual(
+            [first._pick_word() for _ in range(10)],
+            [second._pick_word() for _ in range(10)],
+        )
+
+    def test_rng_state_round_trip(self):
+        """Test that restoring the RNG state replays the same shuffle."""
+        game = TeamSupremeScribbles(num_players=1)
+        replay = TeamSupremeScribbles(num_players=1)
+        replay.set_rng_state(game.get_rng_state())
+        self.assertEqual(
+            [game._pick_word() for _ in range(10)],
+            [replay._pick_word() for _ in range(10)],
+        )
 
 
 class TestTeamSupremeScribblesRounds(unittest.TestCase):
@@ -75,13 +106,12 @@ class TestTeamSupremeScribblesRounds(unittest.TestCase):
         self.assertTrue(result["success"])
         self.assertEqual(result["round"], 1)
         self.assertEqual(result["drawer"], 0)
-        self.assertIn(result["word"], WORD_LIST)
+        self.assertIn(result["word"], WORD_SET)
         self.assertEqual(game.state, ScribblesGameState.DRAWING)
 
     def test_cannot_start_round_while_drawing(self):
         """Test that start_round fails during a drawing round."""
-        game = TeamSupremeScribbles(num_players=2)
-        game.start_round()
+        game = _started_game(2)
         result = game.start_round()
         self.assertFalse(result["success"])
 
@@ -138,8 +168,7 @@ class TestTeamSupremeScribblesGuessing(unittest.TestCase):
 
     def test_correct_guess(self):
         """Test that a correct guess awards points."""
-        game = TeamSupremeScribbles(num_players=3)
-        game.start_round()
+        game = _started_game(3)
         word = game.current_word
         correct, msg = game.guess(1, word)
         self.assertTrue(correct)
@@ -149,8 +178,7 @@ class TestTeamSupremeScribblesGuessing(unittest.TestCase):
 
     def test_incorrect_guess(self):
         """Test that an incorrect guess does not award points."""
-        game = TeamSupremeScribbles(num_players=3)
-        game.start_round()
+        game = _started_game(3)
         correct, msg = game.guess(1, "definitely_wrong_answer_xyz")
         self.assertFalse(correct)
         self.assertEqual(game.scores[1], 0)
@@ -158,16 +186,14 @@ class TestTeamSupremeScribblesGuessing(unittest.TestCase):
 
     def test_case_insensitive_guess(self):
         """Test that guessing is case insensitive."""
-        game = TeamSupremeScribbles(num_players=2)
-        game.start_round()
+        game = _started_game(2)
         word = game.current_word
         correct, msg = game.guess(1, word.upper())
         self.assertTrue(correct)
 
     def test_drawer_cannot_guess(self):
         """Test that the drawer cannot submit a guess."""
-        game = TeamSupremeScribbles(num_players=2)
-        game.start_round()
+        game = _started_game(2)
         correct, msg = game.guess(0, game.current_word)
         self.assertFalse(correct)
         self.assertIn("drawer cannot guess", msg)
@@ -181,8 +207,7 @@ class TestTeamSupremeScribblesGuessing(unittest.TestCase):
 
     def test_invalid_player_guess(self):
         """Test that an invalid player ID is rejected."""
-        game = TeamSupremeScribbles(num_players=2)
-        game.start_round()
+        game = _started_game(2)
         correct, msg = game.guess(99, game.current_word)
         self.assertFalse(correct)
         self.assertIn("Invalid player", msg)
@@ -193,8 +218,7 @@ class TestTeamSupremeScribblesEndDrawing(unittest.TestCase):
 
     def test_end_drawing(self):
         """Test ending a drawing round."""
-        game = TeamSupremeScribbles(num_players=2)
-        game.start_round()
+        game = _started_game(2)
         success, msg = game.end_drawing()
         self.assertTrue(success)
         self.assertEqual(game.state, ScribblesGameState.ROUND_END)
@@ -211,8 +235,7 @@ class TestTeamSupremeScribblesGameInfo(unittest.TestCase):
 
     def test_get_game_info(self):
         """Test get_game_info returns correct data."""
-        game = TeamSupremeScribbles(num_players=3)
-        game.start_round()
+        game = _started_game(3)
         info = game.get_game_info()
         self.assertEqual(info["num_players"], 3)
         self.assertEqual(info["num_rounds"], 3)
@@ -221,17 +244,39 @@ class TestTeamSupremeScribblesGameInfo(unittest.TestCase):
         self.assertEqual(info["current_drawer"], 0)
         self.assertIn("scores", info)
 
-    def test_get_drawer_info(self):
-        """Test get_drawer_info includes the secret word."""
+    def test_get_game_info_is_read_only_view(self):
+        """Test get_game_info reuses one read-only view that tracks state."""
         game = TeamSupremeScribbles(num_players=2)
+        info = game.get_game_info()
+        with self.assertRaises(TypeError):
+            info["current_round"] = 5
         game.start_round()
+        self.assertIs(game.get_game_info(), info)
+        self.assertEqual(info["state"], "drawing")
+
+    def test_get_drawer_info(self):
+        """Test get_drawer_info includes the secret word."""
+        game = _started_game(2)
         info = game.get_drawer_info()
         self.assertEqual(info["drawer_id"], 0)
         self.assertIsNotNone(info["word"])
 
+    def test_snapshot(self):
+        """Test snapshot reflects state changes."""
+        game = TeamSupremeScribbles(num_players=2)
+        self.assertEqual(game.snapshot(), (ScribblesGameState.WAITING, 0, 0, (0, 0)))
+        game.start_round()
+        game.guess(1, game.current_word)
+        self.assertEqual(game.snapshot(), (ScribblesGameState.ROUND_END, 1, 0, (1, 1)))
+
+    def test_game_has_no_instance_dict(self):
+        """Test the game stores its fields in slots."""
+        game = TeamSupremeScribbles(num_players=2)
+        self.assertFalse(hasattr(game, "__dict__"))
+
     def test_word_picking_avoids_repeats(self):
         """Test that words are not immediately repeated."""
-        game = TeamSupremeScribbles(num_players=2, num_rounds=10)
+        game = TeamSupremeScribbles(num_players=2, num_rounds=10, seed=0)
         words_seen = []
         for _ in range(10):
             game.start_round()
@@ -244,36 +289,47 @@ class TestTeamSupremeScribblesGameInfo(unittest.TestCase):
 class TestTeamSupremeScribblesFullGame(unittest.TestCase):
     """Integration test for a full game flow."""
 
-    def test_full_game_two_players(self):
-        """Test a complete game with two players and 1 round."""
+    def test_score_accumulates_across_rounds(self):
+        """Test that points from successive turns add up for both roles."""
         game = TeamSupremeScribbles(num_players=2, num_rounds=1)
 
-        # Turn 1: player 0 draws, player 1 guesses correctly
-        result = game.start_round()
-        self.assertTrue(result["success"])
-        self.assertEqual(result["drawer"], 0)
-        word = game.current_word
-        correct, _ = game.guess(1, word)
-        self.assertTrue(correct)
-        self.assertEqual(game.scores[0], 1)
-        self.assertEqual(game.scores[1], 1)
+        # Player 0 draws for player 1, then player 1 draws for player 0
+        for guesser in (1, 0):
+            game.start_round()
+            game.guess(guesser, game.current_word)
 
-        # Turn 2: player 1 draws, player 0 guesses wrong then right
-        result = game.start_round()
-        self.assertTrue(result["success"])
-        self.assertEqual(result["drawer"], 1)
-        word = game.current_word
-        correct, _ = game.guess(0, "wrong answer")
-        self.assertFalse(correct)
-        correct, _ = game.guess(0, word)
-        self.assertTrue(correct)
-        self.assertEqual(game.scores[0], 2)
-        self.assertEqual(game.scores[1], 2)
+        self.assertEqual(list(game.scores), [2, 2])
+        self.assertEqual(game.start_round()["final_scores"], [2, 2])
 
-        # Game should be over now
-        result = game.start_round()
-        self.assertTrue(result.get("game_over"))
-        self.assertEqual(game.state, ScribblesGameState.GAME_OVER)
+
+class TestSimulateMany(unittest.TestCase):
+    """Test cases for the batch simulation entry point."""
+
+    def test_scores_layout(self):
+        """Test one score per player per game, two points per guessed turn."""
+        scores = simulate_many(n_games=50, num_players=3, num_rounds=2, seed=1)
+        self.assertEqual(len(scores), 150)
+        for g in range(50):
+            game_scores = scores[g * 3:g * 3 + 3]
+            self.assertEqual(sum(game_scores) % 2, 0)
+            self.assertLessEqual(sum(game_scores), 2 * 3 * 2)
+
+    def test_same_seed_same_scores(self):
+        """Test that a seed makes the simulation reproducible."""
+        self.assertEqual(
+            simulate_many(20, 4, seed=9), simulate_many(20, 4, seed=9)
+        )
+
+    def test_single_player_never_scores(self):
+        """Test that a lone drawer has nobody to guess."""
+        self.assertEqual(list(simulate_many(5, 1, seed=2)), [0] * 5)
+
+    def test_invalid_sizes(self):
+        """Test that empty batches and games are rejected."""
+        with self.assertRaises(ValueError):
+            simulate_many(0, 2)
+        with self.assertRaises(ValueError):
+            simulate_many(2, 0)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,30 @@ Unit tests for The Mind card game.
 """
 
 import unittest
-from the_mind import TheMind, GameState
+from the_mind import TheMind, GameState, _hand_mask, simulate_many
+
+
+def _level_game(num_players=2):
+    """Create a game with its first level already dealt."""
+    game = TheMind(num_players=num_players)
+    game.setup_level()
+    return game
+
+
+def _hands(game):
+    """Return every player's hand as a sorted card list."""
+    return {pid: game.get_player_hand(pid) for pid in range(game.num_players)}
+
+
+def _rigged_game(hands, played=None, level=1, lives=None):
+    """Create a game mid-level with the given hands, skipping the deal."""
+    game = TheMind(num_players=len(hands))
+    game.state = GameState.IN_PROGRESS
+    game.current_level = level
+    game._set_table([_hand_mask(hands[pid]) for pid in range(len(hands))], played or ())
+    if lives is not None:
+        game.lives = lives
+    return game
 
 
 class TestTheMindGame(unittest.TestCase):
@@ -24,25 +47,33 @@ class TestTheMindGame(unittest.TestCase):
             TheMind(num_players=1)
         with self.assertRaises(ValueError):
             TheMind(num_players=5)
+        with self.assertRaises(ValueError):
+            TheMind(num_players=2.5)
     
     def test_level_setup(self):
         """Test that level setup deals correct number of cards."""
-        game = TheMind(num_players=2)
-        game.setup_level()
+        game = _level_game(2)
         
         # Each player should have cards equal to current level
         self.assertEqual(len(game.get_player_hand(0)), game.current_level)
         self.assertEqual(len(game.get_player_hand(1)), game.current_level)
         self.assertEqual(game.state, GameState.IN_PROGRESS)
     
-    def test_play_card_in_order(self):
-        """Test playing cards in correct order."""
-        game = TheMind(num_players=2)
+    def test_final_level_deals_distinct_cards(self):
+        """Test that a full four-player deal never repeats a card."""
+        game = TheMind(num_players=4)
+        game.current_level = TheMind.MAX_LEVELS
         game.setup_level()
         
+        dealt = [card for pid in range(4) for card in game.get_player_hand(pid)]
+        self.assertEqual(len(dealt), 4 * TheMind.MAX_LEVELS)
+        self.assertEqual(len(set(dealt)), len(dealt))
+        self.assertTrue(all(TheMind.CARD_MIN <= c <= TheMind.CARD_MAX for c in dealt))
+    
+    def test_play_card_in_order(self):
+        """Test playing cards in correct order."""
         # Manually set up a simple scenario
-        game.player_hands = {0: [10, 50], 1: [20, 60]}
-        game.played_pile = []
+        game = _rigged_game({0: [10, 50], 1: [20, 60]})
         
         # Play cards in order
         success, msg = game.play_card(0, 10)
@@ -53,14 +84,28 @@ class TestTheMindGame(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(game.played_pile, [10, 20])
     
+    def test_play_card_not_in_hand(self):
+        """Test that cards a player does not hold are rejected."""
+        game = _rigged_game({0: [10], 1: [20]})
+        for card in (20, 0, -5, 101):
+            with self.subTest(card=card):
+                success, msg = game.play_card(0, card)
+                self.assertFalse(success)
+                self.assertIn("does not have", msg)
+        self.assertEqual(_hands(game), {0: [10], 1: [20]})
+    
+    def test_invalid_player_id(self):
+        """Test that out-of-range player IDs are rejected, including negatives."""
+        game = _rigged_game({0: [10], 1: [20]})
+        for player_id in (-1, 2):
+            with self.subTest(player_id=player_id):
+                self.assertEqual(game.play_card(player_id, 20), (False, "Invalid player ID"))
+                self.assertEqual(game.get_player_hand(player_id), [])
+    
     def test_play_card_out_of_order(self):
         """Test that playing out of order loses a life."""
-        game = TheMind(num_players=2)
-        game.setup_level()
-        
         # Set up scenario where playing out of order will occur
-        game.player_hands = {0: [30], 1: [20]}
-        game.played_pile = []
+        game = _rigged_game({0: [30], 1: [20]})
         initial_lives = game.lives
         
         # Play 30 first
@@ -74,29 +119,19 @@ class TestTheMindGame(unittest.TestCase):
     
     def test_throwing_star(self):
         """Test using throwing star to discard lowest cards."""
-        game = TheMind(num_players=2)
-        game.setup_level()
-        
-        game.player_hands = {0: [10, 50], 1: [20, 60]}
+        game = _rigged_game({0: [10, 50], 1: [20, 60]})
         initial_stars = game.throwing_stars
         
         success, discarded = game.use_throwing_star()
         self.assertTrue(success)
         self.assertEqual(game.throwing_stars, initial_stars - 1)
-        self.assertEqual(discarded[0], 10)
-        self.assertEqual(discarded[1], 20)
-        self.assertEqual(game.player_hands[0], [50])
-        self.assertEqual(game.player_hands[1], [60])
+        self.assertEqual(discarded, {0: 10, 1: 20})
+        self.assertEqual(_hands(game), {0: [50], 1: [60]})
     
     def test_level_completion(self):
         """Test that level completes when all cards are played."""
-        game = TheMind(num_players=2)
-        game.current_level = 1
-        game.setup_level()
-        
         # Set up simple scenario
-        game.player_hands = {0: [10], 1: [20]}
-        game.played_pile = []
+        game = _rigged_game({0: [10], 1: [20]})
         
         # Play all cards
         game.play_card(0, 10)
@@ -107,13 +142,8 @@ class TestTheMindGame(unittest.TestCase):
     
     def test_game_won(self):
         """Test that game is won after completing all 12 levels."""
-        game = TheMind(num_players=2)
-        game.current_level = 12
-        game.setup_level()
-        
         # Set up to complete level 12
-        game.player_hands = {0: [], 1: []}
-        game.state = GameState.IN_PROGRESS
+        game = _rigged_game({0: [], 1: []}, level=12)
         
         # Trigger level completion check
         game._complete_level()
@@ -122,13 +152,8 @@ class TestTheMindGame(unittest.TestCase):
     
     def test_game_lost(self):
         """Test that game is lost when lives reach 0."""
-        game = TheMind(num_players=2)
-        game.setup_level()
-        game.lives = 1
-        
         # Set up scenario to lose last life
-        game.player_hands = {0: [5], 1: [30]}
-        game.played_pile = [10]
+        game = _rigged_game({0: [5], 1: [30]}, played=[10], lives=1)
         
         # Play card out of order (5 < 10)
         game.play_card(0, 5)
@@ -138,8 +163,7 @@ class TestTheMindGame(unittest.TestCase):
     
     def test_get_game_info(self):
         """Test that game info returns correct data."""
-        game = TheMind(num_players=3)
-        game.setup_level()
+        game = _level_game(3)
         
         info = game.get_game_info()
         self.assertEqual(info["num_players"], 3)
@@ -149,52 +173,69 @@ class TestTheMindGame(unittest.TestCase):
         self.assertIn("state", info)
         self.assertIn("played_pile", info)
     
-    def test_skipped_cards_loses_life(self):
-        """Test that playing a card higher than another player's card loses a life."""
+    def test_get_game_info_is_read_only_view(self):
+        """Test get_game_info reuses one read-only view that tracks state."""
         game = TheMind(num_players=2)
+        info = game.get_game_info()
+        with self.assertRaises(TypeError):
+            info["lives"] = 5
         game.setup_level()
+        self.assertIs(game.get_game_info(), info)
+        self.assertEqual(info["state"], "in_progress")
+    
+    def test_game_has_no_instance_dict(self):
+        """Test the game stores its fields in slots."""
+        self.assertFalse(hasattr(TheMind(num_players=2), "__dict__"))
+    
+    def test_get_game_info_without_pile(self):
+        """Test that the pile can be summarised instead of copied."""
+        game = _rigged_game({0: [10, 50], 1: [20]}, played=[5])
+        game.play_card(0, 10)
         
-        # Player 0 has 50, Player 1 has 20
-        game.player_hands = {0: [50], 1: [20]}
-        game.played_pile = []
-        initial_lives = game.lives
-        
-        # Player 0 plays 50, skipping Player 1's 20
-        success, msg = game.play_card(0, 50)
-        self.assertTrue(success)
-        self.assertEqual(game.lives, initial_lives - 1)
-        self.assertIn("skipped", msg)
-        # Player 1's card 20 should be discarded
-        self.assertEqual(game.player_hands[1], [])
-        self.assertIn(20, game.discarded_cards)
+        info = game.get_game_info(include_pile=False)
+        self.assertNotIn("played_pile", info)
+        self.assertEqual((info["played_pile_len"], info["played_pile_top"]), (2, 10))
+        self.assertEqual(game.get_game_info()["played_pile"], [5, 10])
     
-    def test_skipped_cards_multiple_players(self):
-        """Test skipped cards across multiple players."""
-        game = TheMind(num_players=3)
-        game.setup_level()
+    def test_cards_in_play_tracks_plays_and_discards(self):
+        """Test that cards_in_play drops with plays, skips and throwing stars."""
+        game = _rigged_game({0: [10, 50, 70], 1: [20, 30, 90]})
+        self.assertEqual(game.get_game_info()["cards_in_play"], 6)
         
-        # Player 0 has 60, Player 1 has 20, Player 2 has 40
-        game.player_hands = {0: [60], 1: [20], 2: [40]}
-        game.played_pile = []
-        initial_lives = game.lives
+        game.play_card(0, 10)
+        game.play_card(1, 30)  # skips player 1's 20
+        self.assertEqual(game.get_game_info()["cards_in_play"], 3)
         
-        # Player 0 plays 60, skipping cards 20 and 40
-        success, msg = game.play_card(0, 60)
-        self.assertTrue(success)
-        self.assertEqual(game.lives, initial_lives - 1)
-        self.assertEqual(game.player_hands[1], [])
-        self.assertEqual(game.player_hands[2], [])
-        self.assertIn(20, game.discarded_cards)
-        self.assertIn(40, game.discarded_cards)
+        game.use_throwing_star()
+        self.assertEqual(game.get_game_info()["cards_in_play"], 1)
+        self.assertEqual(_hands(game), {0: [70], 1: []})
+    
+    def test_skipped_cards_lose_a_life(self):
+        """Test that cards between the pile top and the played card are discarded."""
+        cases = [
+            # hands, pile, player 0 plays, discarded, hands afterwards
+            ({0: [50], 1: [20]}, [], 50, [20], {0: [], 1: []}),
+            ({0: [60], 1: [20], 2: [40]}, [], 60, [20, 40], {0: [], 1: [], 2: []}),
+            # A player's own lower cards are skipped too
+            ({0: [10, 50], 1: [60]}, [], 50, [10], {0: [], 1: [60]}),
+            # Only cards above the pile top are skipped; 25 stays in hand
+            ({0: [50], 1: [25, 40]}, [30], 50, [40], {0: [], 1: [25]}),
+        ]
+        for hands, played, card, discarded, hands_after in cases:
+            with self.subTest(hands=hands, played=played):
+                game = _rigged_game(hands, played=played)
+                initial_lives = game.lives
+                success, msg = game.play_card(0, card)
+                self.assertTrue(success)
+                self.assertIn("skipped", msg)
+                self.assertEqual(game.lives, initial_lives - 1)
+                self.assertEqual(list(game.discarded_cards), discarded)
+                self.assertEqual(_hands(game), hands_after)
     
     def test_no_skipped_cards_no_life_loss(self):
         """Test that playing the lowest available card does not lose a life."""
-        game = TheMind(num_players=2)
-        game.setup_level()
-        
         # Player 0 has 10, Player 1 has 50
-        game.player_hands = {0: [10], 1: [50]}
-        game.played_pile = []
+        game = _rigged_game({0: [10], 1: [50]})
         initial_lives = game.lives
         
         # Player 0 plays 10 (no cards lower than 10 exist)
@@ -203,57 +244,41 @@ class TestTheMindGame(unittest.TestCase):
         self.assertEqual(game.lives, initial_lives)
         self.assertNotIn("skipped", msg)
     
-    def test_skipped_cards_own_hand(self):
-        """Test that a player's own lower cards are also discarded."""
-        game = TheMind(num_players=2)
-        game.setup_level()
-        
-        # Player 0 has 10 and 50, Player 1 has 60
-        game.player_hands = {0: [10, 50], 1: [60]}
-        game.played_pile = []
-        initial_lives = game.lives
-        
-        # Player 0 plays 50, their own 10 should be skipped
-        success, msg = game.play_card(0, 50)
-        self.assertTrue(success)
-        self.assertEqual(game.lives, initial_lives - 1)
-        self.assertEqual(game.player_hands[0], [])
-        self.assertIn(10, game.discarded_cards)
-    
     def test_skipped_cards_game_over(self):
         """Test that skipped cards can cause game over."""
-        game = TheMind(num_players=2)
-        game.setup_level()
-        game.lives = 1
-        
         # Player 0 has 50, Player 1 has 20
-        game.player_hands = {0: [50], 1: [20]}
-        game.played_pile = []
+        game = _rigged_game({0: [50], 1: [20]}, lives=1)
         
         # Player 0 plays 50, skipping Player 1's 20
         success, msg = game.play_card(0, 50)
         self.assertTrue(success)
         self.assertEqual(game.lives, 0)
         self.assertEqual(game.state, GameState.GAME_LOST)
+
+
+class TestSimulateMany(unittest.TestCase):
+    """Test cases for the batch simulation entry point."""
     
-    def test_skipped_cards_with_pile_context(self):
-        """Test that only cards between last played and played card are skipped."""
-        game = TheMind(num_players=2)
-        game.setup_level()
-        
-        # Pile already has card 30
-        game.player_hands = {0: [50], 1: [25, 40]}
-        game.played_pile = [30]
-        initial_lives = game.lives
-        
-        # Player 0 plays 50. Player 1's 40 is between 30 and 50 (skipped).
-        # Player 1's 25 is NOT between 30 and 50 (not skipped).
-        success, msg = game.play_card(0, 50)
-        self.assertTrue(success)
-        self.assertEqual(game.lives, initial_lives - 1)
-        self.assertIn(40, game.discarded_cards)
-        self.assertNotIn(25, game.discarded_cards)
-        self.assertEqual(game.player_hands[1], [25])
+    def test_levels_in_range(self):
+        """Test one result per game, each a count of completed levels."""
+        levels = simulate_many(n_games=50, num_players=3, seed=1)
+        self.assertEqual(len(levels), 50)
+        self.assertTrue(all(0 <= lv <= TheMind.MAX_LEVELS for lv in levels))
+    
+    def test_perfect_timing_always_wins(self):
+        """Test that without jitter the lowest card is always played first."""
+        self.assertEqual(list(simulate_many(10, 4, jitter=0)), [TheMind.MAX_LEVELS] * 10)
+    
+    def test_same_seed_same_results(self):
+        """Test that a seed makes the simulation reproducible."""
+        self.assertEqual(simulate_many(20, 2, seed=9), simulate_many(20, 2, seed=9))
+    
+    def test_invalid_arguments(self):
+        """Test that empty batches, bad player counts and jitter are rejected."""
+        for args, kwargs in (((0, 2), {}), ((2, 5), {}), ((2, 2), {"jitter": 1.0})):
+            with self.subTest(args=args, kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    simulate_many(*args, **kwargs)
 
 
 if __name__ == "__main__":
@@ -6,21 +6,74 @@ communicating verbally or through gestures.
 """
 
 import random
-from typing import List, Dict, Tuple, TypedDict
+from array import array
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 from enum import Enum
 
 
-class GameInfo(TypedDict):
-    """Type definition for game information dictionary."""
-    num_players: int
-    current_level: int
-    lives: int
-    max_lives: int
-    throwing_stars: int
-    max_throwing_stars: int
-    state: str
-    played_pile: List[int]
-    cards_in_play: int
+def _hand_mask(cards: Iterable[int]) -> int:
+    """
+    Pack cards into a hand bitmask.
+    
+    Args:
+        cards: Card values to set
+        
+    Returns:
+        Bitmask with bit ``c`` set for every card ``c``
+    """
+    hand = 0
+    for card in cards:
+        hand |= 1 << card
+    return hand
+
+
+def _cards_in(hand: int) -> List[int]:
+    """
+    Expand a hand bitmask into its cards.
+    
+    Args:
+        hand: Bitmask with bit ``c`` set for every card ``c`` held
+        
+    Returns:
+        List of cards in ascending order
+    """
+    cards = []
+    while hand:
+        low = hand & -hand
+        cards.append(low.bit_length() - 1)
+        hand ^= low
+    return cards
+
+
+def _between_mask(low: int, high: int) -> int:
+    """Bitmask of the cards strictly between ``low`` and ``high``."""
+    if high <= low + 1:
+        return 0
+    return (1 << high) - (1 << (low + 1))
+
+
+def _discard_between(hands: List[int], low: int, high: int) -> int:
+    """
+    Remove every card strictly between ``low`` and ``high`` from all hands.
+    
+    Args:
+        hands: Hand bitmasks, updated in place
+        low: Exclusive lower bound (the pile top)
+        high: Exclusive upper bound (the card just played)
+        
+    Returns:
+        Bitmask of all removed cards
+    """
+    mask = _between_mask(low, high)
+    removed = 0
+    if mask:
+        for player_id, hand in enumerate(hands):
+            bad = hand & mask
+            if bad:
+                hands[player_id] = hand ^ bad
+                removed |= bad
+    return removed
 
 
 class GameState(Enum):
@@ -39,6 +92,13 @@ class TheMind:
     Manages game state, card dealing, and gameplay mechanics.
     """
     
+    __slots__ = (
+        "num_players", "current_level", "state", "max_lives",
+        "max_throwing_stars", "lives", "throwing_stars", "player_hands",
+        "played_pile", "_top", "_cards_remaining", "discarded_cards",
+        "_info", "_info_view",
+    )
+    
     MAX_LEVELS = 12
     CARD_MIN = 1
     CARD_MAX = 100
@@ -50,6 +110,8 @@ class TheMind:
         3: (3, 1),  # 3 players: 3 lives, 1 throwing star
         4: (4, 1),  # 4 players: 4 lives, 1 throwing star
     }
+    # The same configuration indexed directly by player count
+    _CFG_BY_N = (None, None, PLAYER_CONFIG[2], PLAYER_CONFIG[3], PLAYER_CONFIG[4])
     
     def __init__(self, num_players: int):
         """
@@ -61,7 +123,7 @@ class TheMind:
         Raises:
             ValueError: If number of players is invalid
         """
-        if num_players not in self.PLAYER_CONFIG:
+        if not isinstance(num_players, int) or not 2 <= num_players <= 4:
             raise ValueError(f"Invalid number of players. Must be 2-4, got {num_players}")
         
         self.num_players = num_players
@@ -69,38 +131,57 @@ class TheMind:
         self.state = GameState.SETUP
         
         # Get lives and throwing stars based on player count
-        self.max_lives, self.max_throwing_stars = self.PLAYER_CONFIG[num_players]
+        self.max_lives, self.max_throwing_stars = self._CFG_BY_N[num_players]
         self.lives = self.max_lives
         self.throwing_stars = self.max_throwing_stars
         
-        # Initialize deck and hands
-        self.deck: List[int] = []
-        self.player_hands: Dict[int, List[int]] = {i: [] for i in range(num_players)}
-        self.played_pile: List[int] = []
+        # Hands are indexed by player ID, each a bitmask of its cards. The
+        # pile top and cards left in hands are maintained incrementally, so
+        # replace hands or pile only through _set_table()
+        self._set_table([0] * num_players)
+        
+        # Track discarded cards (from throwing stars); every card fits a byte
+        self.discarded_cards = array("B")
         
-        # Track discarded cards (from throwing stars)
-        self.discarded_cards: List[int] = []
+        # Backing dict for get_game_info(); the fixed fields are filled in
+        # once here and the rest are refreshed on each call
+        self._info: dict = {
+            "num_players": num_players,
+            "max_lives": self.max_lives,
+            "max_throwing_stars": self.max_throwing_stars,
+        }
+        self._info_view: Mapping = MappingProxyType(self._info)
     
     def setup_level(self) -> None:
-        """Set up a new level by shuffling deck and dealing cards."""
-        # Create a fresh deck of cards
-        self.deck = list(range(self.CARD_MIN, self.CARD_MAX + 1))
-        random.shuffle(self.deck)
+        """Set up a new level by dealing cards from a fresh deck."""
+        self.discarded_cards = array("B")
         
-        # Clear previous hands and played pile
-        self.player_hands = {i: [] for i in range(self.num_players)}
-        self.played_pile = []
-        self.discarded_cards = []
-        
-        # Deal cards to each player (number of cards = current level)
+        # Draw only the cards being dealt (number per player = current level)
         cards_per_player = self.current_level
-        for player_id in range(self.num_players):
-            self.player_hands[player_id] = sorted([
-                self.deck.pop() for _ in range(cards_per_player)
-            ])
+        drawn = random.sample(
+            range(self.CARD_MIN, self.CARD_MAX + 1),
+            self.num_players * cards_per_player,
+        )
+        self._set_table([
+            _hand_mask(drawn[start:start + cards_per_player])
+            for start in range(0, len(drawn), cards_per_player)
+        ])
         
         self.state = GameState.IN_PROGRESS
     
+    def _set_table(self, hands: List[int], played: Iterable[int] = ()) -> None:
+        """
+        Replace every hand and the played pile, resyncing the cached counters.
+        
+        Args:
+            hands: Hand bitmask for each player, indexed by player ID
+            played: Cards already on the pile, bottom first
+        """
+        self.player_hands = hands
+        self.played_pile = list(played)
+        self._top = self.played_pile[-1] if self.played_pile else 0
+        self._cards_remaining = sum(hand.bit_count() for hand in hands)
+    
     def play_card(self, player_id: int, card: int) -> Tuple[bool, str]:
         """
         Attempt to play a card from a player's hand.
@@ -115,22 +196,24 @@ class TheMind:
         if self.state != GameState.IN_PROGRESS:
             return False, "Game is not in progress"
         
-        if player_id not in self.player_hands:
+        if not 0 <= player_id < self.num_players:
             return False, "Invalid player ID"
         
-        if card not in self.player_hands[player_id]:
+        if not (0 < card <= self.CARD_MAX and self.player_hands[player_id] >> card & 1):
             return False, f"Player {player_id} does not have card {card}"
         
         # Check if card can be played in order
-        last_played_card = self.played_pile[-1] if self.played_pile else 0
+        last_played_card = self._top
         if card < last_played_card:
             # Card is out of order - lose a life and discard cards
             self._handle_out_of_order(card)
             return False, f"Card {card} played out of order! Lost a life."
         
         # Card can be played
-        self.player_hands[player_id].remove(card)
+        self.player_hands[player_id] ^= 1 << card
+        self._cards_remaining -= 1
         self.played_pile.append(card)
+        self._top = card
         
         # Check if any cards were skipped (other players had lower cards)
         were_cards_skipped = self._handle_skipped_cards(last_played_card, card)
@@ -161,16 +244,10 @@ class TheMind:
         self.lives -= 1
         
         # Discard all cards from all players that should have been played
-        last_played = self.played_pile[-1] if self.played_pile else 0
-        
-        for player_id in self.player_hands:
-            cards_to_discard = [
-                card for card in self.player_hands[player_id]
-                if last_played < card < failed_card
-            ]
-            for card in cards_to_discard:
-                self.player_hands[player_id].remove(card)
-                self.discarded_cards.append(card)
+        removed = _discard_between(self.player_hands, self._top, failed_card)
+        if removed:
+            self._cards_remaining -= removed.bit_count()
+            self.discarded_cards.extend(_cards_in(removed))
         
         if self.lives <= 0:
             self.state = GameState.GAME_LOST
@@ -187,20 +264,11 @@ class TheMind:
         Returns:
             True if cards were skipped (life lost), False otherwise
         """
-        skipped_cards: List[int] = []
+        skipped = _discard_between(self.player_hands, last_played_card, played_card)
         
-        for player_id in self.player_hands:
-            cards_to_discard = [
-                card for card in self.player_hands[player_id]
-                if last_played_card < card < played_card
-            ]
-            self.player_hands[player_id] = [
-                c for c in self.player_hands[player_id] if c not in cards_to_discard
-            ]
-            self.discarded_cards.extend(cards_to_discard)
-            skipped_cards.extend(cards_to_discard)
-        
-        if skipped_cards:
+        if skipped:
+            self._cards_remaining -= skipped.bit_count()
+            self.discarded_cards.extend(_cards_in(skipped))
             self.lives -= 1
             if self.lives <= 0:
                 self.state = GameState.GAME_LOST
@@ -224,10 +292,12 @@ class TheMind:
         discarded = {}
         
         # Each player discards their lowest card
-        for player_id in self.player_hands:
-            if self.player_hands[player_id]:
-                lowest_card = min(self.player_hands[player_id])
-                self.player_hands[player_id].remove(lowest_card)
+        for player_id, hand in enumerate(self.player_hands):
+            if hand:
+                lowest = hand & -hand
+                lowest_card = lowest.bit_length() - 1
+                self.player_hands[player_id] = hand ^ lowest
+                self._cards_remaining -= 1
                 self.discarded_cards.append(lowest_card)
                 discarded[player_id] = lowest_card
         
@@ -235,8 +305,7 @@ class TheMind:
     
     def _is_level_complete(self) -> bool:
         """Check if all cards have been played for the current level."""
-        total_cards_in_hands = sum(len(hand) for hand in self.player_hands.values())
-        return total_cards_in_hands == 0
+        return self._cards_remaining == 0
     
     def _complete_level(self) -> None:
         """Mark the current level as complete and advance to next level."""
@@ -248,24 +317,33 @@ class TheMind:
         else:
             self.current_level += 1
     
-    def get_game_info(self) -> GameInfo:
+    def get_game_info(self, include_pile: bool = True) -> Mapping:
         """
         Get current game information.
         
+        The same read-only view is returned on every call and is updated
+        in place, so copy it if a snapshot needs to outlive the next call.
+        
+        Args:
+            include_pile: Whether to include a copy of the whole played pile;
+                its length and top card (0 if empty) are always included
+        
         Returns:
-            Dictionary with game state information
+            Read-only mapping with game state information
         """
-        return {
-            "num_players": self.num_players,
-            "current_level": self.current_level,
-            "lives": self.lives,
-            "max_lives": self.max_lives,
-            "throwing_stars": self.throwing_stars,
-            "max_throwing_stars": self.max_throwing_stars,
-            "state": self.state.value,
-            "played_pile": self.played_pile.copy(),
-            "cards_in_play": sum(len(hand) for hand in self.player_hands.values()),
-        }
+        info = self._info
+        info["current_level"] = self.current_level
+        info["lives"] = self.lives
+        info["throwing_stars"] = self.throwing_stars
+        info["state"] = self.state.value
+        info["played_pile_len"] = len(self.played_pile)
+        info["played_pile_top"] = self._top
+        info["cards_in_play"] = self._cards_remaining
+        if include_pile:
+            info["played_pile"] = self.played_pile.copy()
+        else:
+            info.pop("played_pile", None)
+        return self._info_view
     
     def get_player_hand(self, player_id: int) -> List[int]:
         """
@@ -277,11 +355,87 @@ class TheMind:
         Returns:
             List of cards in player's hand
         """
-        if player_id in self.player_hands:
-            return sorted(self.player_hands[player_id])
+        if 0 <= player_id < self.num_players:
+            return _cards_in(self.player_hands[player_id])
         return []
 
 
+def simulate_many(
+    n_games: int,
+    num_players: int,
+    jitter: float = 0.2,
+    seed: Optional[int] = None,
+) -> array:
+    """
+    Play many games with a timing policy, for strategy and balance sweeps.
+    
+    Each player waits to play their lowest card for a time proportional
+    to its distance above the pile top, scaled by a random factor in
+    ``[1 - jitter, 1 + jitter]``; whoever's wait ends first plays. With no
+    jitter every game is won. Skipped cards cost a life as in play_card.
+    Throwing stars are not used.
+    
+    Args:
+        n_games: Number of games to simulate
+        num_players: Players per game (2-4)
+        jitter: Relative timing noise, from 0 (perfect) to below 1
+        seed: Optional seed for reproducible results
+        
+    Returns:
+        Number of levels completed in each game, 0 to MAX_LEVELS
+        
+    Raises:
+        ValueError: If n_games, num_players or jitter is out of range
+    """
+    if n_games < 1:
+        raise ValueError(f"Simulation needs at least one game, got {n_games}")
+    if num_players not in TheMind.PLAYER_CONFIG:
+        raise ValueError(f"Invalid number of players. Must be 2-4, got {num_players}")
+    if not 0 <= jitter < 1:
+        raise ValueError(f"Jitter must be in [0, 1), got {jitter}")
+    
+    rng = random.Random(seed)
+    sample, uniform = rng.sample, rng.uniform
+    deck = range(TheMind.CARD_MIN, TheMind.CARD_MAX + 1)
+    max_lives = TheMind.PLAYER_CONFIG[num_players][0]
+    results = array("i", [0] * n_games)
+    
+    for g in range(n_games):
+        lives = max_lives
+        level = 1
+        while lives and level <= TheMind.MAX_LEVELS:
+            drawn = sample(deck, num_players * level)
+            hands = [
+                _hand_mask(drawn[start:start + level])
+                for start in range(0, len(drawn), level)
+            ]
+            top = 0
+            remaining = len(drawn)
+            while remaining:
+                best_wait = float("inf")
+                for player_id, hand in enumerate(hands):
+                    if hand:
+                        lowest = hand & -hand
+                        wait = (lowest.bit_length() - 1 - top) * uniform(1 - jitter, 1 + jitter)
+                        if wait < best_wait:
+                            best_wait, best_player, best_bit = wait, player_id, lowest
+                hands[best_player] ^= best_bit
+                remaining -= 1
+                card = best_bit.bit_length() - 1
+                
+                skipped = _discard_between(hands, top, card)
+                if skipped:
+                    remaining -= skipped.bit_count()
+                    lives -= 1
+                    if not lives:
+                        break
+                top = card
+            else:
+                level += 1
+        results[g] = level - 1
+    return results
+
+
 def main():
     """Example game execution."""
     print("=== The Mind - Cooperative Card Game ===\n")